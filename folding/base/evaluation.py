@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class BaseEvaluator(ABC):
+    # Output files produced while evaluating a miner. Subclasses set the ones they create.
+    checkpoint_path: Optional[str] = None
+    system_config_path: Optional[str] = None
+    log_file_path: Optional[str] = None
+    state_xml_path: Optional[str] = None
+    trajectory_path: Optional[str] = None
+
     @abstractmethod
     def name(self) -> str:
         ...
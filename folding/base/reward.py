@@ -1,7 +1,7 @@
 import time
 import torch
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from abc import ABC, abstractmethod
 
 from folding.store import Job
@@ -38,6 +38,12 @@ class BatchRewardInput(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    @field_validator("energies", mode="before")
+    @classmethod
+    def _as_tensor(cls, energies):
+        """Accepts NumPy arrays and sequences; arrays are wrapped without a copy."""
+        return torch.as_tensor(energies)
+
 
 class BaseReward(ABC):
     @abstractmethod
@@ -28,11 +28,12 @@ import bittensor as bt
 from pathlib import Path
 from datetime import datetime
 from folding.utils.logger import logger
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from folding.mock import MockDendrite
 from folding.base.neuron import BaseNeuron
 from folding.utils.ops import print_on_retry
+from folding.utils.uids import clear_availability_cache
 from folding.utils.config import add_validator_args
 from folding.organic.validator import OrganicValidator
 from folding.registries.miner_registry import MinerRegistry
@@ -57,6 +58,8 @@ class BaseValidatorNeuron(BaseNeuron):
 
         # Save a copy of the hotkeys to local memory.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
+        # The metagraph hotkeys as an array, so many uids can be mapped at once.
+        self._hotkeys_np = np.array(self.metagraph.hotkeys, dtype=object)
 
         # Dendrite lets us send messages to other nodes (axons) in the network.
         if self.config.mock:
@@ -83,6 +86,8 @@ class BaseValidatorNeuron(BaseNeuron):
         self.loop = asyncio.get_event_loop()
 
         # Instantiate runners
+        # Set when the validator should shut down; should_exit reads and writes it.
+        self.exit_event = asyncio.Event()
         self.should_exit: bool = False
         self.is_running: bool = False
         self.thread: threading.Thread = None
@@ -196,6 +201,8 @@ class BaseValidatorNeuron(BaseNeuron):
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
+        clear_availability_cache()
+        self._hotkeys_np = np.array(self.metagraph.hotkeys, dtype=object)
 
         # Check if the metagraph axon info has changed.
         if previous_metagraph.axons == self.metagraph.axons:
@@ -222,8 +229,26 @@ class BaseValidatorNeuron(BaseNeuron):
         # Update the hotkeys.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
 
-    async def update_scores(self, rewards: torch.FloatTensor, uids: List[int]):
+    @property
+    def should_exit(self) -> bool:
+        return self.exit_event.is_set()
+
+    @should_exit.setter
+    def should_exit(self, value: bool):
+        if value:
+            self.exit_event.set()
+        else:
+            self.exit_event.clear()
+
+    async def wait_closed(self):
+        """Waits until the validator has been asked to shut down."""
+        await self.exit_event.wait()
+
+    async def update_scores(
+        self, rewards: Union[torch.FloatTensor, np.ndarray], uids: List[int]
+    ):
         """Performs exponential moving average on the scores based on the rewards received from the miners."""
+        rewards = torch.as_tensor(rewards, dtype=torch.float32)
 
         # Check if rewards contains NaN values.
         if torch.isnan(rewards).any():
@@ -10,6 +10,9 @@ from typing import Optional
 
 app = FastAPI()
 
+# Maximum number of organic jobs sent to the main process in a single pipe message.
+MAX_BATCH_SIZE = 64
+
 app.include_router(organic_router)
 
 
@@ -24,7 +27,9 @@ async def start_organic_api(organic_validator, config):
         "folding.organic.api:app",
         host="0.0.0.0",
         port=config.neuron.organic_api.port,
-        loop="asyncio",
+        loop="auto",
+        http="auto",
+        access_log=False,
         reload=False,
     )
     server = uvicorn.Server(config)
@@ -46,36 +51,69 @@ def api_process_main(pipe_connection: Connection, config):
     import asyncio
     from asyncio import Task
 
+    class NotifyingOrganicQueue(OrganicQueue):
+        """OrganicQueue that sets `new_item` whenever a job is added."""
+
+        def __init__(self, new_item: asyncio.Event):
+            super().__init__()
+            self._new_item = new_item
+
+        def add(self, sample):
+            super().add(sample)
+            # The organic routes run on the same loop as check_queue.
+            self._new_item.set()
+
     # Create a dummy validator object that will send jobs through the pipe
     class PipeOrganicValidator:
         def __init__(self, pipe_connection):
-            self._organic_queue = OrganicQueue()
             self._pipe_connection = pipe_connection
             self._check_queue_task: Optional[Task] = None
+            # Wakes check_queue whenever a job is enqueued instead of polling.
+            self._new_item = asyncio.Event()
+            self._organic_queue = NotifyingOrganicQueue(self._new_item)
 
         async def check_queue(self):
-            """Periodically check the queue and send jobs to the main process"""
+            """Wait for jobs to be enqueued and send them to the main process"""
             while True:
+                await self._new_item.wait()
+                self._new_item.clear()
                 try:
-                    if not self._organic_queue.is_empty():
-                        # Get all items from the queue
+                    # Send in batches of at most MAX_BATCH_SIZE so a large backlog
+                    # doesn't turn into one huge pickle on the pipe.
+                    while not self._organic_queue.is_empty():
                         items = []
-                        while not self._organic_queue.is_empty():
+                        while (
+                            len(items) < MAX_BATCH_SIZE
+                            and not self._organic_queue.is_empty()
+                        ):
                             item = self._organic_queue.sample()
                             if item:
                                 items.append(item)
 
-                        # Send items through the pipe
+                        # Send items through the pipe. send_bytes avoids Connection.send
+                        # pickling the already-pickled payload a second time.
                         if items:
                             logger.info(f"Sending {len(items)} jobs to main process")
-                            self._pipe_connection.send(pickle.dumps(items))
+                            self._pipe_connection.send_bytes(
+                                pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)
+                            )
+                        await asyncio.sleep(0)
                 except Exception as e:
                     logger.error(f"Error checking queue: {e}")
-                await asyncio.sleep(
-                    1
-                )  # Check more frequently than the main process reads
 
-    # Set up the API
+    # Set up the API. "auto" selects uvloop and httptools when they are installed
+    # and falls back to asyncio and h11 otherwise.
+    uvicorn_config = uvicorn.Config(
+        "folding.organic.api:app",
+        host="0.0.0.0",
+        port=config.neuron.organic_api.port,
+        loop="auto",
+        http="auto",
+        access_log=False,
+        reload=False,
+    )
+    uvicorn_config.setup_event_loop()
+
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
@@ -92,14 +130,6 @@ def api_process_main(pipe_connection: Connection, config):
     app.state.config = config
 
     # Start the API
-    uvicorn_config = uvicorn.Config(
-        "folding.organic.api:app",
-        host="0.0.0.0",
-        port=config.neuron.organic_api.port,
-        loop="asyncio",
-        reload=False,
-    )
-
     server = uvicorn.Server(uvicorn_config)
     loop.run_until_complete(server.serve())
 
@@ -22,6 +22,7 @@ from folding.utils.ops import (
     save_pdb,
     write_pkl,
     check_uniqueness,
+    window_median,
 )
 from folding.utils.opemm_simulation_config import SimulationConfig
 from folding.protocol import IntermediateSubmissionSynapse
@@ -452,13 +453,13 @@ class SyntheticMDEvaluator(BaseEvaluator):
                         "miner-checkpoint-similarity",
                     )
 
-                return True, checked_energies_dict, miner_energies_dict, "valid"
+                return True, checked_energies_dict, miner_energies_dict, c.REASON_VALID
 
         except ValidationError as e:
             logger.warning(f"{e}")
             return False, {}, {}, e.message
 
-        return True, checked_energies_dict, miner_energies_dict, "valid"
+        return True, checked_energies_dict, miner_energies_dict, c.REASON_VALID
 
     def evaluate(self) -> bool:
         """Checks to see if the miner's data can be passed for validation"""
@@ -501,7 +502,7 @@ class SyntheticMDEvaluator(BaseEvaluator):
             logger.success(f"Hotkey {self.hotkey_alias} passed validation!")
             final_energies = checked_energies_dict["final"]
             # Take the median of the last ENERGY_WINDOW_SIZE values
-            median_energy = np.median(final_energies[-c.ENERGY_WINDOW_SIZE :])
+            median_energy = window_median(final_energies, c.ENERGY_WINDOW_SIZE)
             return median_energy, checked_energies_dict, miner_energies_dict, result
         else:
             # This should not happen if is_valid is True, but handle it just in case
@@ -748,7 +749,7 @@ class SyntheticMDEvaluator(BaseEvaluator):
                 logger.warning(
                     f"hotkey {self.hotkey_alias} failed state-checkpoint comparison for {self.pdb_id}, checkpoint_num: {checkpoint_num}, ... Skipping!"
                 )
-                raise ValidationError(message="state-checkpoint")
+                raise ValidationError(message=c.REASON_STATE_CHECKPOINT)
 
             # calculating absolute percent difference per step
             percent_diff = abs(
@@ -797,7 +798,12 @@ class SyntheticMDEvaluator(BaseEvaluator):
 
             self.pdb_files[f"{self.pdb_id}_{checkpoint_num}"] = pdb_output_path
 
-            return True, check_energies.tolist(), miner_energies.tolist(), "valid"
+            return (
+                True,
+                check_energies.tolist(),
+                miner_energies.tolist(),
+                c.REASON_VALID,
+            )
 
         except ValidationError as e:
             logger.warning(f"{e}")
@@ -85,6 +85,22 @@ class MinerRegistry:
         miner = self._get_or_create_miner(miner_uid)
         miner.tasks[task].credibilities.append(credibilities)
 
+    def add_credibilities_bulk(
+        self, miner_uids: List[int], task: str, credibilities: List[float]
+    ) -> None:
+        """Adds a single credibility for each of several miners, checking the task and
+        values once for the whole batch."""
+        if task not in self.tasks:
+            raise ValueError(f"Invalid task: {task}")
+        if len(miner_uids) != len(credibilities):
+            raise ValueError("Expected one credibility per miner")
+        if not all(isinstance(c, (int, float)) for c in credibilities):
+            raise ValueError("All credibilities must be numeric")
+
+        for miner_uid, credibility in zip(miner_uids, credibilities):
+            miner = self._get_or_create_miner(miner_uid)
+            miner.tasks[task].credibilities.append([credibility])
+
     def get_credibilities(self, miner_uid: int, task: str = None) -> List[float]:
         """Returns the credibilities for a miner and task."""
         if task not in self.tasks:
@@ -101,14 +117,24 @@ class MinerRegistry:
         if task not in self.tasks:
             raise ValueError(f"Invalid task: {task}")
 
-        miner = self._get_or_create_miner(miner_uid)
-        task_metrics = miner.tasks[task]
+        self._update_task_credibility(self._get_or_create_miner(miner_uid), task)
+
+    def update_credibilities(self, miner_uids: List[int], task: str) -> None:
+        """Updates the credibility of several miners for a specific task, checking the
+        task once for the whole batch."""
+        if task not in self.tasks:
+            raise ValueError(f"Invalid task: {task}")
 
-        # Flatten credibilities list and process each credibility
-        task_credibilities = list(chain.from_iterable(task_metrics.credibilities))
+        for miner_uid in miner_uids:
+            self._update_task_credibility(self._get_or_create_miner(miner_uid), task)
+
+    def _update_task_credibility(self, miner: MinerData, task: str) -> None:
+        """Folds the pending credibilities of a miner's task into its EMA."""
+        task_metrics = miner.tasks[task]
 
+        # Process each pending credibility in order.
         current_credibility = task_metrics.credibility
-        for cred in task_credibilities:
+        for cred in chain.from_iterable(task_metrics.credibilities):
             alpha = (
                 c.CREDIBILITY_ALPHA_POSITIVE
                 if cred > 0
@@ -34,6 +34,8 @@ class SQLiteJobStore:
         self.table_name = table_name
         self.db_file = os.path.join(self.db_path, "db.sqlite")
         self.epistula = Epistula()
+        # Reuse keep-alive connections to rqlite and the GJP across calls.
+        self.session = requests.Session()
 
     def _row_to_job(self, row) -> "Job":
         """Convert a database row to a Job object."""
@@ -84,12 +86,12 @@ class SQLiteJobStore:
                 AND datetime(updated_at, '+' || update_interval || ' seconds') <= datetime('{now}')
                 AND validator_hotkey = '{validator_hotkey}'
             """
-            response = requests.get(
+            response = self.session.get(
                 f"http://{db_addr}/db/query",
                 params={"q": query, "level": "strong"},
             )
         else:
-            response = requests.get(
+            response = self.session.get(
                 f"http://{db_addr}/db/query",
                 params={
                     "q": f"SELECT * FROM {self.table_name} WHERE active = 1 AND validator_hotkey = '{validator_hotkey}'",
@@ -130,7 +132,7 @@ class SQLiteJobStore:
             AND updated_at >= '{last_time_checked}'
             ORDER BY updated_at ASC
         """
-        response = requests.get(
+        response = self.session.get(
             f"http://{db_addr}/db/query",
             params={
                 "q": query,
@@ -178,7 +180,7 @@ class SQLiteJobStore:
         body_bytes = self.epistula.create_message_body(body)
         headers = self.epistula.generate_header(hotkey=keypair, body=body_bytes)
 
-        response = requests.post(
+        response = self.session.post(
             f"http://{gjp_address}/jobs/update/{job_id}",
             headers=headers,
             data=body_bytes,
@@ -195,7 +197,7 @@ class SQLiteJobStore:
         Returns:
             list: List of PDB IDs as strings
         """
-        response = requests.get(
+        response = self.session.get(
             f"http://{db_addr}/db/query",
             params={
                 "q": f"SELECT pdb_id FROM {self.table_name}",
@@ -288,7 +290,7 @@ class SQLiteJobStore:
         body_bytes = self.epistula.create_message_body(body)
         headers = self.epistula.generate_header(hotkey=keypair, body=body_bytes)
 
-        response = requests.post(
+        response = self.session.post(
             f"http://{gjp_address}/jobs", headers=headers, data=body_bytes
         )
         if response.status_code != 200:
@@ -307,7 +309,7 @@ class SQLiteJobStore:
             str: The job ID of the confirmed job.
         """
 
-        response = requests.get(
+        response = self.session.get(
             f"http://{db_addr}/db/query",
             params={"q": f"SELECT * FROM jobs WHERE job_id = '{job_id}'"},
         )
@@ -333,13 +335,13 @@ class SQLiteJobStore:
         Returns:
             bool: True if the database has changed, False otherwise.
         """
-        response = requests.get(f"http://{db_addr}/status?pretty ")
+        response = self.session.get(f"http://{db_addr}/status?pretty ")
         if response.status_code != 200:
             raise ValueError(f"Failed to monitor db: {response.text}")
 
         last_log_leader = response.json()["store"]["raft"]["last_log_index"]
 
-        response = requests.get(f"http://{db_addr}/status?pretty ")
+        response = self.session.get(f"http://{db_addr}/status?pretty ")
         if response.status_code != 200:
             raise ValueError(f"Failed to monitor db: {response.text}")
         last_log_read = response.json()["store"]["raft"]["last_log_index"]
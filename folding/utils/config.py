@@ -338,6 +338,13 @@ def add_validator_args(cls, parser):
         default=10,
     )
 
+    parser.add_argument(
+        "--neuron.max_concurrent_evaluations",
+        type=int,
+        help="The number of miner responses to evaluate at once. Each evaluation builds an OpenMM simulation.",
+        default=1,
+    )
+
     parser.add_argument(
         "--neuron.sample_size",
         type=int,
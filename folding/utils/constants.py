@@ -29,3 +29,8 @@ CREDIBILITY_ALPHA_NEGATIVE = 0.25
 # Validation constants
 MAX_CHECKPOINTS_TO_VALIDATE = 3
 INTERMEDIATE_CHECKPOINT_STEPS = 1000
+
+# Validation reasons. These are stored in job events and logged, so they stay strings.
+REASON_VALID = "valid"
+REASON_SKIP = "skip"  # Validation was skipped by the credibility coin flip.
+REASON_STATE_CHECKPOINT = "state-checkpoint"
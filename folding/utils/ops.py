@@ -464,3 +464,17 @@ def check_uniqueness(vectors, tol=0.01):
             if are_vectors_too_similar(vectors_np[i], vectors_np[j], tol):
                 return False
     return True
+
+
+def window_median(values, window: int) -> float:
+    """Median of the last `window` values, using a partial sort instead of a full one."""
+    tail = np.asarray(values[-window:], dtype=np.float64)
+    n = tail.size
+    if n == 0:
+        return float("nan")
+
+    mid = n // 2
+    if n % 2:
+        return float(np.partition(tail, mid)[mid])
+    tail = np.partition(tail, (mid - 1, mid))
+    return float((tail[mid - 1] + tail[mid]) / 2)
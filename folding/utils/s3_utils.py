@@ -1,8 +1,9 @@
 import os
 import datetime
+import threading
 import boto3
 import mimetypes
-from typing import Optional, Dict, cast, Any
+from typing import Optional, Dict, List, cast, Any
 from abc import ABC, abstractmethod
 from botocore.client import Config
 from botocore.exceptions import ClientError
@@ -13,6 +14,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Uploads, downloads and presigning run from worker threads, so the shared client's
+# connection pool is sized for many concurrent requests.
+S3_MAX_POOL_CONNECTIONS = 64
+
 
 class S3Config:
     """Configuration class for S3 client."""
@@ -108,18 +113,34 @@ class DigitalOceanS3Handler(BaseHandler):
             ".dcd": "application/octet-stream",
         }
 
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+
     @property
     def s3_client(self):
-        """Creates a configured S3 client on demand."""
-
-        return boto3.client(
-            "s3",
-            region_name=self.config.region_name,
-            endpoint_url=self.config.endpoint_url,
-            aws_access_key_id=self.config.access_key_id,
-            aws_secret_access_key=self.config.secret_access_key,
-            config=Config(signature_version="s3v4"),
-        )
+        """Returns the handler's S3 client, creating it on first use.
+
+        The client is shared so that every call reuses its pooled connections. boto3
+        clients are thread-safe once created; creation happens under a lock with its
+        own session because the default boto3 session is not safe to share across
+        worker threads.
+        """
+        if self._s3_client is None:
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = boto3.session.Session().client(
+                        "s3",
+                        region_name=self.config.region_name,
+                        endpoint_url=self.config.endpoint_url,
+                        aws_access_key_id=self.config.access_key_id,
+                        aws_secret_access_key=self.config.secret_access_key,
+                        config=Config(
+                            signature_version="s3v4",
+                            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                            retries={"max_attempts": 3, "mode": "adaptive"},
+                        ),
+                    )
+        return self._s3_client
 
     def _get_content_type(
         self, file_path: str, content_type: Optional[str] = None
@@ -234,16 +255,58 @@ class DigitalOceanS3Handler(BaseHandler):
         Raises:
             ClientError: If URL generation fails.
         """
+        return self._presign(
+            self.s3_client, miner_hotkey, pdb_id, file_name, expires_in, method
+        )
+
+    def generate_presigned_urls(
+        self,
+        miner_hotkeys: List[str],
+        pdb_id: str,
+        file_name: str,
+        expires_in: int = 7200,
+        method: str = "get_object",
+    ) -> List[dict[str, Any]]:
+        """Generates presigned URLs for several miners using a single S3 client.
+
+        Args:
+            miner_hotkeys (List[str]): The hotkeys of the miners, one URL per hotkey.
+            pdb_id (str): The pdb id of the job.
+            file_name (str): The name of the file to presign.
+            expires_in (int): Number of seconds until the URLs expire.
+            method (str): The S3 operation to allow ('get_object' or 'put_object').
+
+        Returns:
+            List[dict[str, Any]]: The presigned URLs, in the order of miner_hotkeys.
+        """
+        s3_client = self.s3_client
+        return [
+            self._presign(
+                s3_client, miner_hotkey, pdb_id, file_name, expires_in, method
+            )
+            for miner_hotkey in miner_hotkeys
+        ]
+
+    def _presign(
+        self,
+        s3_client,
+        miner_hotkey: str,
+        pdb_id: str,
+        file_name: str,
+        expires_in: int,
+        method: str,
+    ) -> dict[str, Any]:
+        """Presigns a single object location with the given client."""
         location = self._get_location(miner_hotkey, pdb_id, file_name)
         content_type = self._get_content_type(file_name)
         try:
             if method == "get_object":
-                return self.s3_client.generate_presigned_url(
+                return s3_client.generate_presigned_url(
                     method,
                     Params={"Bucket": self.config.miner_bucket_name, "Key": location},
                 )
             elif method == "put_object":
-                return self.s3_client.generate_presigned_post(
+                return s3_client.generate_presigned_post(
                     Bucket=self.config.miner_bucket_name,
                     Key=location,
                     Fields={
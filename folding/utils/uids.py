@@ -1,5 +1,15 @@
 import bittensor as bt
-from typing import List
+import numpy as np
+from typing import Dict, List, Tuple
+
+# Availability results for the current block, keyed on
+# (id(metagraph), block, vpermit_tao_limit, include_serving_in_check).
+_AVAILABILITY_CACHE: Dict[Tuple, np.ndarray] = {}
+
+
+def clear_availability_cache() -> None:
+    """Drops all cached availability results, e.g. after the metagraph is synced."""
+    _AVAILABILITY_CACHE.clear()
 
 
 def check_uid_availability(
@@ -35,15 +45,31 @@ def get_all_miner_uids(
         uids (List): All available miner uids.
         include_serving_in_check (bool): To only include miners that are actually serving in the check.
     """
-    candidate_uids = []
-    for uid in range(metagraph.n.item()):
-        uid_is_available = check_uid_availability(
-            metagraph=metagraph,
-            uid=uid,
-            vpermit_tao_limit=vpermit_tao_limit,
-            include_serving_in_check=include_serving_in_check,
+    key = (
+        id(metagraph),
+        int(metagraph.block),
+        vpermit_tao_limit,
+        include_serving_in_check,
+    )
+    cached = _AVAILABILITY_CACHE.get(key)
+    if cached is not None:
+        return cached.tolist()
+
+    # Only the latest block is ever queried, so drop entries from older blocks.
+    if any(k[1] != key[1] for k in _AVAILABILITY_CACHE):
+        _AVAILABILITY_CACHE.clear()
+
+    n = int(metagraph.n)
+    stake = metagraph.S
+    stake = stake.cpu().numpy() if hasattr(stake, "cpu") else np.asarray(stake)
+
+    # Same predicate as check_uid_availability, evaluated for every uid at once.
+    mask = ~(stake[:n] > vpermit_tao_limit)
+    if include_serving_in_check:
+        mask &= np.fromiter(
+            (axon.is_serving for axon in metagraph.axons[:n]), dtype=bool, count=n
         )
-        if uid_is_available:
-            candidate_uids.append(uid)
 
-    return candidate_uids
+    uids = np.flatnonzero(mask)
+    _AVAILABILITY_CACHE[key] = uids
+    return uids.tolist()
@@ -4,7 +4,7 @@ import time
 import numpy as np
 from tqdm import tqdm
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Set
 
 from async_timeout import timeout
 from folding.validators.protein import Protein
@@ -42,12 +42,12 @@ def parse_config(config) -> Dict[str, str]:
 
 
 # TODO: We need to be able to create a bunch of different challenges.
-async def create_new_challenge(self, exclude: List) -> Dict:
+async def create_new_challenge(self, exclude: Set[str]) -> Dict:
     """Create a new challenge by sampling a random pdb_id and running a hyperparameter search
     using the try_prepare_md_challenge function.
 
     Args:
-        exclude (List): list of pdb_ids to exclude from the search
+        exclude (Set[str]): set of pdb_ids to exclude from the search
 
     Returns:
         Dict: event dictionary containing the results of the hyperparameter search
@@ -85,7 +85,7 @@ async def create_new_challenge(self, exclude: List) -> Dict:
             logger.debug(
                 f"❌❌ All hyperparameter combinations failed for pdb_id {pdb_id}.. Skipping! ❌❌"
             )
-            exclude.append(pdb_id)
+            exclude.add(pdb_id)
 
 
 def create_random_modifications_to_system_config(config) -> Dict:
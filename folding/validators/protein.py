@@ -1,4 +1,5 @@
 import os
+import ast
 import time
 import glob
 import base64
@@ -80,9 +81,9 @@ class Protein(OpenMMSimulation):
         self.box: Literal["cube", "dodecahedron", "octahedron"] = box
         self.water: str = water
 
-        # The dict is saved as a string in the event, so it needs to be evaluated.
+        # The dict is saved as a string in the event, so it needs to be parsed.
         if isinstance(system_kwargs, str):
-            system_kwargs = eval(system_kwargs)
+            system_kwargs = ast.literal_eval(system_kwargs)
 
         self.system_config = SimulationConfig(
             ff=self.ff,
@@ -112,7 +113,7 @@ class Protein(OpenMMSimulation):
         # If a pdb file path is provided copy the file to the base directory.
 
         self.pdb_file = f"{self.pdb_id}.pdb"
-        self.pdb_directory = os.path.join(self.base_directory, self.pdb_id)
+        self.pdb_directory = Protein.get_pdb_directory(self.pdb_id)
         self.pdb_location = os.path.join(self.pdb_directory, self.pdb_file)
         if self.pdb_file_path:
             shutil.copy(
@@ -131,6 +132,11 @@ class Protein(OpenMMSimulation):
             self.pdb_directory, "velm_array_indicies.pkl"
         )
 
+    @staticmethod
+    def get_pdb_directory(pdb_id: str) -> str:
+        """Returns the directory that holds the files of a protein."""
+        return os.path.join(str(ROOT_DIR), "data", pdb_id.lower())
+
     @staticmethod
     async def from_job(job: Job, config: Dict):
         # Load_md_inputs is set to True to ensure that miners get files every query.
@@ -1,9 +1,12 @@
 import time
-from typing import List, Dict, Any
+import heapq
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 import numpy as np
-from collections import defaultdict
 from folding.utils.logger import logger
+from folding.utils.ops import window_median
 from folding.utils import constants as c
 from folding.validators.protein import Protein
 from folding.base.evaluation import BaseEvaluator
@@ -12,86 +15,138 @@ from folding.registries.miner_registry import MinerRegistry
 from folding.registries.evaluation_registry import EVALUATION_REGISTRY
 from folding.utils.s3_utils import DigitalOceanS3Handler
 
+# (miner_files key, evaluator attribute) for the output files logged per miner.
+_FILE_ATTRS = (
+    ("best_cpt", "checkpoint_path"),
+    ("system_config", "system_config_path"),
+    ("log_file_path", "log_file_path"),
+    ("state_xml_path", "state_xml_path"),
+    ("trajectory_path", "trajectory_path"),
+)
 
-def evaluate(
+
+def _evaluate_one(
+    protein: Protein,
+    resp: JobSubmissionSynapse,
+    uid: int,
+    job_type: str,
+    s3_handler: DigitalOceanS3Handler,
+) -> Tuple[int, Optional[BaseEvaluator], Dict[str, Any]]:
+    """Evaluates a single miner's response. Returns the evaluator and the logs to record,
+    or a None evaluator if the response could not be processed."""
+    try:
+        if resp.dendrite.status_code != 200:
+            return uid, None, {}
+
+        start_time = time.time()
+        evaluator: BaseEvaluator = EVALUATION_REGISTRY[job_type](
+            pdb_id=protein.pdb_id,
+            pdb_location=protein.pdb_location,
+            hotkey=resp.axon.hotkey,
+            state=resp.miner_state,
+            seed=resp.miner_seed,
+            md_output=resp.md_output,
+            basepath=protein.pdb_directory,
+            system_config=protein.system_config,
+            velm_array_pkl_path=protein.velm_array_pkl,
+            trajectory_path=resp.presigned_url,
+            s3_handler=s3_handler,
+            trajectory_s3_path=resp.presigned_url["fields"]["key"],
+        )
+
+        can_process = evaluator.evaluate()
+        if not can_process:
+            logger.info(f"uid {uid} failed to process")
+            return uid, None, {}
+
+        miner_files = {
+            name: getattr(evaluator, attr, None) or "" for name, attr in _FILE_ATTRS
+        }
+
+        logs = {
+            "can_process": can_process,
+            "reported_energy": evaluator.get_reported_energy(),
+            "seed": resp.miner_seed,
+            "files": miner_files,
+            "process_md_output_time": time.time() - start_time,
+            "axon": resp.axon,
+        }
+        return uid, evaluator, logs
+
+    except Exception as e:
+        # If any of the above methods have an error, we will catch here.
+        logger.error(f"Failed to parse miner data for uid {uid} with error: {e}")
+        return uid, None, {}
+
+
+def start_evaluation(
+    protein: Protein,
+    resp: JobSubmissionSynapse,
+    uid: int,
+    job_type: str,
+    s3_handler: DigitalOceanS3Handler,
+    executor: ThreadPoolExecutor,
+) -> "asyncio.Future[Tuple[int, Optional[BaseEvaluator], Dict[str, Any]]]":
+    """Queues a miner's response for evaluation on the validator's evaluation pool.
+
+    Each evaluation downloads the miner's outputs and builds an OpenMM simulation
+    from them. The pool size comes from neuron.max_concurrent_evaluations; with the
+    default of 1 evaluations run one at a time, off the event loop.
+    """
+    return asyncio.get_running_loop().run_in_executor(
+        executor, _evaluate_one, protein, resp, uid, job_type, s3_handler
+    )
+
+
+async def evaluate(
     protein: Protein,
     responses: List[JobSubmissionSynapse],
     uids: List[int],
     job_type: str,
     s3_handler: DigitalOceanS3Handler,
     miner_registry: MinerRegistry,
+    executor: ThreadPoolExecutor,
+    evaluations: Optional[List[asyncio.Future]] = None,
 ):
-    """Evaluates the miner's response and updates the miner registry."""
-    evaluators = {}
+    """Evaluates the miners' responses on `executor` and updates the miner registry.
 
-    for uid, resp in zip(uids, responses):
-        miner_files = {}
-        try:
-            if resp.dendrite.status_code != 200:
-                continue
+    Evaluations already started with start_evaluation can be passed in `evaluations`,
+    in the same order as `uids`.
+    """
+    evaluators = {}
 
-            start_time = time.time()
-            evaluator: BaseEvaluator = EVALUATION_REGISTRY[job_type](
-                pdb_id=protein.pdb_id,
-                pdb_location=protein.pdb_location,
-                hotkey=resp.axon.hotkey,
-                state=resp.miner_state,
-                seed=resp.miner_seed,
-                md_output=resp.md_output,
-                basepath=protein.pdb_directory,
-                system_config=protein.system_config,
-                velm_array_pkl_path=protein.velm_array_pkl,
-                trajectory_path=resp.presigned_url,
-                s3_handler=s3_handler,
-                trajectory_s3_path=resp.presigned_url["fields"]["key"],
-            )
+    if evaluations is None:
+        evaluations = [
+            start_evaluation(protein, resp, uid, job_type, s3_handler, executor)
+            for uid, resp in zip(uids, responses)
+        ]
+    results = await asyncio.gather(*evaluations)
 
-            can_process = evaluator.evaluate()
-            if not can_process:
-                logger.info(f"uid {uid} failed to process")
-                continue
+    # Registry writes happen here on the event loop thread, not in the workers.
+    for uid, evaluator, logs in results:
+        if evaluator is None:
+            continue
+        miner_registry.registry[uid].logs.update(logs)
+        evaluators[uid] = evaluator
 
-            miner_files["best_cpt"] = (
-                evaluator.checkpoint_path
-                if hasattr(evaluator, "checkpoint_path")
-                else ""
-            )
-            miner_files["system_config"] = (
-                evaluator.system_config_path
-                if hasattr(evaluator, "system_config_path")
-                else ""
-            )
-            miner_files["log_file_path"] = (
-                evaluator.log_file_path if hasattr(evaluator, "log_file_path") else ""
-            )
-            miner_files["state_xml_path"] = (
-                evaluator.state_xml_path if hasattr(evaluator, "state_xml_path") else ""
-            )
+    return miner_registry, evaluators
 
-            miner_files["trajectory_path"] = (
-                evaluator.trajectory_path
-                if hasattr(evaluator, "trajectory_path")
-                else ""
-            )
 
-            miner_registry.registry[uid].logs["can_process"] = can_process
-            miner_registry.registry[uid].logs[
-                "reported_energy"
-            ] = evaluator.get_reported_energy()
-            miner_registry.registry[uid].logs["seed"] = resp.miner_seed
-            miner_registry.registry[uid].logs["files"] = miner_files
-            miner_registry.registry[uid].logs["process_md_output_time"] = (
-                time.time() - start_time
-            )
-            miner_registry.registry[uid].logs["axon"] = resp.axon
-            evaluators[uid] = evaluator
+def _iter_by_reported_energy(
+    all_miner_logs: Dict[int, Dict[str, Any]], limit: int
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yields miner logs in ascending order of reported energy.
 
-        except Exception as e:
-            # If any of the above methods have an error, we will catch here.
-            logger.error(f"Failed to parse miner data for uid {uid} with error: {e}")
-            continue
+    The validation loop usually stops after TOP_K entries, so only the lowest `limit`
+    are selected up front; the rest are sorted only if the loop runs past them.
+    """
+    key = lambda item: item[1]["reported_energy"]
+    items = list(all_miner_logs.items())
 
-    return miner_registry, evaluators
+    # nsmallest is stable, so this matches the first `limit` entries of a full sort.
+    yield from heapq.nsmallest(limit, items, key=key)
+    if len(items) > limit:
+        yield from sorted(items, key=key)[limit:]
 
 
 async def run_evaluation_validation_pipeline(
@@ -103,6 +158,7 @@ async def run_evaluation_validation_pipeline(
     job_type: str,
     job_id: str,
     axons: Dict[int, Any],
+    evaluations: Optional[List[asyncio.Future]] = None,
 ):
     """Takes all the data from reponse synapses, checks if the data is valid, and returns the energies.
 
@@ -110,6 +166,8 @@ async def run_evaluation_validation_pipeline(
         protein (Protein): instance of the Protein class
         responses (List[JobSubmissionSynapse]): list of JobSubmissionSynapse objects
         uids (List[int]): list of uids
+        evaluations (Optional[List[asyncio.Future]]): evaluations already started
+            with start_evaluation, in the same order as uids
 
     Returns:
         Tuple: Tuple containing the energies and the event dictionary
@@ -119,26 +177,31 @@ async def run_evaluation_validation_pipeline(
     energies = {uid: 0 for uid in uids}
 
     # Get initial evaluations
-    miner_registry, evaluators = evaluate(
+    miner_registry, evaluators = await evaluate(
         protein=protein,
         responses=responses,
         uids=uids,
         job_type=job_type,
         s3_handler=validator.handler,
         miner_registry=miner_registry,
+        executor=validator.evaluation_executor,
+        evaluations=evaluations,
     )
 
     all_miner_logs: Dict[int, Dict[str, Any]] = miner_registry.get_all_miner_logs()
-    sorted_dict = dict(
-        sorted(all_miner_logs.items(), key=lambda item: item[1]["reported_energy"])
-    )
+    candidates = _iter_by_reported_energy(all_miner_logs, limit=TOP_K * 8)
 
     valid_unique_count = 0
     processed_uids = []
-    unique_energies = set()  # Track unique energy values
+    # Unique energy values bucketed by DIFFERENCE_THRESHOLD. Any energy within the
+    # threshold of a new one lives in the same or an adjacent bucket.
+    unique_energies: Dict[int, List[float]] = {}
+
+    # One validation coin flip per candidate, drawn up front.
+    coins = np.random.rand(len(all_miner_logs))
 
     # Process responses until we get TOP_K valid non-duplicate ones or run out of responses
-    for uid, miner_data in sorted_dict.items():
+    for idx, (uid, miner_data) in enumerate(candidates):
         try:
             reported_energy = miner_data["reported_energy"]
 
@@ -146,6 +209,7 @@ async def run_evaluation_validation_pipeline(
                 continue
 
             evaluator: BaseEvaluator = evaluators[uid]
+            logs = miner_registry.registry[uid].logs
 
             if reported_energy == 0:
                 continue
@@ -159,7 +223,7 @@ async def run_evaluation_validation_pipeline(
 
             # Calculate the probability of validation based on the miner's credibility
             start_time = time.time()
-            if np.random.rand() < validation_probability:
+            if coins[idx] < validation_probability:
                 (
                     median_energy,
                     checked_energies,
@@ -180,31 +244,28 @@ async def run_evaluation_validation_pipeline(
                     reported_energy,
                     evaluator.final_miner_energies,
                     evaluator.final_miner_energies,
-                    "skip",
+                    c.REASON_SKIP,
                 )
 
             # Add intermediate checkpoint files to files dictionary
             # They only exist after validation
-            for (
-                checkpoint_num,
-                checkpoint_path,
-            ) in evaluator.intermediate_checkpoint_files.items():
-                miner_registry.registry[uid].logs["files"][
-                    f"checkpoint_{checkpoint_num}"
-                ] = checkpoint_path
-
-            miner_registry.registry[uid].logs["files"].update(evaluator.pdb_files)
+            files = logs["files"]
+            files.update(
+                {
+                    f"checkpoint_{checkpoint_num}": checkpoint_path
+                    for checkpoint_num, checkpoint_path in evaluator.intermediate_checkpoint_files.items()
+                }
+            )
+            files.update(evaluator.pdb_files)
             is_valid: bool = median_energy != 0.0
 
             # Update event dictionary for this index
-            miner_registry.registry[uid].logs["is_run_valid_time"] = (
-                time.time() - start_time
-            )
-            miner_registry.registry[uid].logs["reason"] = reason
-            miner_registry.registry[uid].logs["is_valid"] = is_valid
-            miner_registry.registry[uid].logs["ns_computed"] = float(ns_computed)
-            miner_registry.registry[uid].logs["checked_energies"] = checked_energies
-            miner_registry.registry[uid].logs["miner_energies"] = miner_energies
+            logs["is_run_valid_time"] = time.time() - start_time
+            logs["reason"] = reason
+            logs["is_valid"] = is_valid
+            logs["ns_computed"] = float(ns_computed)
+            logs["checked_energies"] = checked_energies
+            logs["miner_energies"] = miner_energies
 
             percent_diff = (
                 abs((median_energy - reported_energy) / reported_energy) * 100
@@ -212,25 +273,28 @@ async def run_evaluation_validation_pipeline(
 
             if is_valid:
                 if percent_diff > c.ANOMALY_THRESHOLD:
-                    miner_registry.registry[uid].logs["is_valid"] = False
-                    miner_registry.registry[uid].logs[
-                        "reason"
-                    ] = "energy_difference_too_large"
+                    logs["is_valid"] = False
+                    logs["reason"] = "energy_difference_too_large"
                     logger.warning(
                         f"uid {uid} has energy percent difference too large: {percent_diff}"
                     )
                     processed_uids.append(uid)
                     continue
 
+                bucket = int(median_energy // c.DIFFERENCE_THRESHOLD)
                 is_duplicate = any(
                     abs(median_energy - energy) < c.DIFFERENCE_THRESHOLD
-                    for energy in unique_energies
+                    for b in (bucket - 1, bucket, bucket + 1)
+                    for energy in unique_energies.get(b, ())
                 )
-                miner_registry.registry[uid].logs["is_duplicate"] = is_duplicate
+                logs["is_duplicate"] = is_duplicate
 
                 if not is_duplicate:
-                    unique_energies.add(median_energy)
+                    unique_energies.setdefault(bucket, []).append(median_energy)
                     valid_unique_count += 1
+                    energies[uid] = window_median(
+                        checked_energies["final"], c.ENERGY_WINDOW_SIZE
+                    )
                     if valid_unique_count == TOP_K:
                         processed_uids.append(uid)
                         break
@@ -242,23 +306,15 @@ async def run_evaluation_validation_pipeline(
             continue
 
     # Update event with only the processed entries
-    event = defaultdict(list)
-    event["processed_uids"] = processed_uids
-
-    if len(processed_uids) > 0:
-        for uid in processed_uids:
-            for key, value in miner_registry.registry[uid].logs.items():
-                event[key].append(value)
-
-    for uid, is_valid, is_duplicate in zip(
-        event["processed_uids"], event["is_valid"], event["is_duplicate"]
-    ):
-        if is_valid and not is_duplicate:
-            energies[uid] = np.median(
-                miner_registry.registry[uid].logs["checked_energies"]["final"][
-                    -c.ENERGY_WINDOW_SIZE :
-                ]
-            )
+    event: Dict[str, List[Any]] = {
+        "processed_uids": processed_uids,
+        "is_valid": [],
+        "is_duplicate": [],
+    }
+    for uid in processed_uids:
+        logs = miner_registry.registry[uid].logs
+        for key, value in logs.items():
+            event.setdefault(key, []).append(value)
 
     # remove all the logs from the miner registry
     miner_registry.reset_miner_logs()
@@ -10,8 +10,10 @@ from slowapi.errors import RateLimitExceeded
 from folding_api.chain import SubtensorService
 from folding_api.protein import router
 from folding_api.utility_endpoints import router as utility_router
+from folding_api.utility_endpoints import PDB_META, load_pdb_meta
 from folding_api.validator_registry import ValidatorRegistry
 from folding_api.auth import APIKeyManager, get_api_key, api_key_router
+from folding_api.utils import close_http_session
 from folding_api.vars import (
     bt_config,
     limiter,
@@ -50,6 +52,10 @@ async def lifespan(app: FastAPI):
     api_key_manager = APIKeyManager()
     app.state.api_key_manager = api_key_manager
 
+    # Load the stored PDB metadata, creating the store on first start.
+    PDB_META.update(await asyncio.to_thread(load_pdb_meta))
+    logger.info(f"Loaded metadata for {len(PDB_META)} PDB entries")
+
     # Start background sync task
     app.state.sync_task = asyncio.create_task(
         sync_metagraph_periodic(subtensor_service, validator_registry)
@@ -68,6 +74,8 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    await close_http_session()
+
 
 app = FastAPI(lifespan=lifespan, name="folding_api", version="0.1.0")
 app.state.limiter = limiter
@@ -1,11 +1,15 @@
+import asyncio
+import gzip
+import sqlite3
 import subprocess
-from typing import Optional, Literal
+from contextlib import closing
+from typing import Dict, Optional, Literal, Tuple
 from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from http import HTTPStatus
 import pickle
 import os
-import pandas as pd
-import requests
+import numpy as np
+import aiohttp
 from loguru import logger
 from folding.utils.ops import convert_cif_to_pdb
 from folding_api.schemas import (
@@ -18,44 +22,107 @@ from folding_api.schemas import (
     Miner,
 )
 from folding_api.auth import APIKey, get_api_key
-from folding_api.utils import query_gjp
+from folding_api.utils import get_http_session, query_gjp
 import json
-import io
 import random
-import math
 
 router = APIRouter(tags=["Utility Endpoints"])
 
 # Global variables to store PDB data
-PDB_DATA = None
-PDB_TO_SOURCE = {}
-ALL_PDB_IDS = []
+PDB_DATA_LOADED = False
+# Lowercased PDB IDs (|S bytes, sorted) and their source codes, memory-mapped from
+# the packed cache built from pdb_ids.pkl. Source codes index PDB_SOURCE_NAMES.
+PDB_SOURCE_NAMES = ("rcsb", "pdbe")
+ALL_PDB_IDS = np.array([], dtype=bytes)
+PDB_SOURCE_CODES = np.array([], dtype=np.uint8)
+# The raw bytes of ALL_PDB_IDS: one NUL-padded record of ALL_PDB_IDS.itemsize bytes
+# per ID, so ID i starts at i * itemsize. PDB_ID_LENGTHS holds each ID's length.
+PDB_BLOB = b""
+PDB_ID_LENGTHS = np.array([], dtype=np.int64)
+# Trigram index, built on the first search that needs it: the sorted distinct
+# trigrams (packed into ints), and for trigram j the sorted indices of the IDs
+# containing it, PDB_TRIGRAM_ROWS[PDB_TRIGRAM_STARTS[j] : PDB_TRIGRAM_STARTS[j + 1]].
+PDB_TRIGRAM_KEYS = None
+PDB_TRIGRAM_STARTS = None
+PDB_TRIGRAM_ROWS = None
+
+
+def build_pdb_cache(pdb_ids_path: str, ids_path: str, sources_path: str):
+    """Converts pdb_ids.pkl into packed NumPy arrays that can be memory-mapped.
+    The IDs are sorted so they can be binary searched.
+
+    Args:
+        pdb_ids_path (str): Path to pdb_ids.pkl.
+        ids_path (str): Output .npy path for the lowercased PDB IDs.
+        sources_path (str): Output .npy path for the source codes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The PDB IDs and source codes.
+    """
+    with open(pdb_ids_path, "rb") as f:
+        pdb_data = pickle.load(f)
+
+    pdb_ids, source_codes = [], []
+    for code, src in enumerate(PDB_SOURCE_NAMES):
+        if src in pdb_data:
+            pdbs = pdb_data[src]["pdbs"]
+            pdb_ids.extend(pdb_id.lower() for pdb_id in pdbs)
+            source_codes.extend([code] * len(pdbs))
+
+    ids = np.array(pdb_ids, dtype=bytes)
+    sources = np.array(source_codes, dtype=np.uint8)
+    order = np.argsort(ids, kind="stable")
+    ids, sources = ids[order], sources[order]
+
+    # Write to temporary files and rename so concurrent workers never map a
+    # partially written cache.
+    try:
+        for path, array in ((ids_path, ids), (sources_path, sources)):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write PDB cache, using in-memory arrays: {e}")
+
+    return ids, sources
 
 
 # Load PDB data when module is initialized
 def load_pdb_data():
-    global PDB_DATA, PDB_TO_SOURCE, ALL_PDB_IDS
+    global PDB_DATA_LOADED, ALL_PDB_IDS, PDB_SOURCE_CODES
+    global PDB_BLOB, PDB_ID_LENGTHS, PDB_TRIGRAM_KEYS
 
     try:
         # Load the PDB IDs from the pickle file
-        pdb_ids_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "pdb_ids.pkl"
-        )
+        base_dir = os.path.dirname(os.path.dirname(__file__))
+        pdb_ids_path = os.path.join(base_dir, "pdb_ids.pkl")
+        ids_path = os.path.join(base_dir, "pdb_ids.sorted.npy")
+        sources_path = os.path.join(base_dir, "pdb_sources.sorted.npy")
 
         if not os.path.exists(pdb_ids_path):
             logger.error("PDB IDs database not found")
             return False
 
-        with open(pdb_ids_path, "rb") as f:
-            PDB_DATA = pickle.load(f)
+        # Rebuild the packed cache whenever the pickle is newer than it.
+        cache_is_fresh = all(
+            os.path.exists(path)
+            and os.path.getmtime(path) >= os.path.getmtime(pdb_ids_path)
+            for path in (ids_path, sources_path)
+        )
+        if cache_is_fresh:
+            ALL_PDB_IDS = np.load(ids_path, mmap_mode="r")
+            PDB_SOURCE_CODES = np.load(sources_path, mmap_mode="r")
+        else:
+            ALL_PDB_IDS, PDB_SOURCE_CODES = build_pdb_cache(
+                pdb_ids_path, ids_path, sources_path
+            )
 
-        # Create a mapping of PDB IDs to their sources
-        for src in ["rcsb", "pdbe"]:
-            if src in PDB_DATA:
-                for pdb_id in PDB_DATA[src]["pdbs"]:
-                    PDB_TO_SOURCE[pdb_id] = src
-                    ALL_PDB_IDS.append(pdb_id)
+        PDB_BLOB = ALL_PDB_IDS.tobytes()
+        PDB_ID_LENGTHS = np.char.str_len(ALL_PDB_IDS)
+        PDB_TRIGRAM_KEYS = None
 
+        PDB_DATA_LOADED = True
         logger.info(f"Loaded {len(ALL_PDB_IDS)} PDB IDs into memory")
         return True
     except Exception as e:
@@ -67,6 +134,127 @@ def load_pdb_data():
 load_pdb_data()
 
 
+def find_pdb_index(pdb_id: bytes) -> int:
+    """Returns the index of `pdb_id` in ALL_PDB_IDS, or -1 if it isn't there."""
+    if not pdb_id or len(pdb_id) > ALL_PDB_IDS.itemsize:
+        return -1
+    idx = int(np.searchsorted(ALL_PDB_IDS, pdb_id))
+    if idx < len(ALL_PDB_IDS) and ALL_PDB_IDS[idx] == pdb_id:
+        return idx
+    return -1
+
+
+def find_pdb_matches(query: str):
+    """Finds the PDB IDs containing `query`.
+
+    Scans PDB_BLOB with bytes.find, which skips through the buffer in C, and jumps
+    to the next record after each hit so only the first match per ID is recorded.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Indices into ALL_PDB_IDS and the position of
+            the match within each ID.
+    """
+    if not query:
+        return np.arange(len(ALL_PDB_IDS)), np.zeros(len(ALL_PDB_IDS), dtype=np.int64)
+
+    needle = query.encode()
+    indices, positions = [], []
+    if b"\x00" in needle:
+        return np.array(indices, dtype=np.int64), np.array(positions, dtype=np.int64)
+
+    # A query as long as the longest ID can only match an ID exactly, and equal IDs
+    # (listed under both sources) sit next to each other in the sorted array.
+    if len(needle) >= ALL_PDB_IDS.itemsize:
+        if len(needle) > ALL_PDB_IDS.itemsize:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        lo = np.searchsorted(ALL_PDB_IDS, needle, side="left")
+        hi = np.searchsorted(ALL_PDB_IDS, needle, side="right")
+        return np.arange(lo, hi, dtype=np.int64), np.zeros(hi - lo, dtype=np.int64)
+
+    if len(needle) >= 3:
+        return _find_pdb_matches_by_trigram(needle)
+
+    width = ALL_PDB_IDS.itemsize
+    hit = PDB_BLOB.find(needle)
+    while hit != -1:
+        idx, position = divmod(hit, width)
+        # IDs that fill their record have no padding after them, so a hit can run
+        # into the next record.
+        if position + len(needle) > PDB_ID_LENGTHS[idx]:
+            hit = PDB_BLOB.find(needle, hit + 1)
+            continue
+        indices.append(idx)
+        positions.append(position)
+        hit = PDB_BLOB.find(needle, (idx + 1) * width)
+
+    return np.array(indices, dtype=np.int64), np.array(positions, dtype=np.int64)
+
+
+def _build_trigram_index():
+    """Builds the trigram index from PDB_BLOB with NumPy, one column of trigram
+    start positions at a time."""
+    global PDB_TRIGRAM_KEYS, PDB_TRIGRAM_STARTS, PDB_TRIGRAM_ROWS
+
+    width = ALL_PDB_IDS.itemsize
+    chars = np.frombuffer(PDB_BLOB, dtype=np.uint8).reshape(-1, width)
+    chars = chars.astype(np.int64)
+
+    keys, rows = [], []
+    for i in range(width - 2):
+        valid = np.flatnonzero(PDB_ID_LENGTHS >= i + 3)
+        keys.append(
+            (chars[valid, i] << 16) | (chars[valid, i + 1] << 8) | chars[valid, i + 2]
+        )
+        rows.append(valid)
+    keys = np.concatenate(keys) if keys else np.array([], dtype=np.int64)
+    rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+
+    # Sort by (trigram, row) and drop repeats of a trigram within the same ID.
+    order = np.lexsort((rows, keys))
+    keys, rows = keys[order], rows[order]
+    keep = np.ones(len(keys), dtype=bool)
+    keep[1:] = (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])
+    keys, rows = keys[keep], rows[keep]
+
+    PDB_TRIGRAM_KEYS, PDB_TRIGRAM_STARTS = np.unique(keys, return_index=True)
+    PDB_TRIGRAM_STARTS = np.append(PDB_TRIGRAM_STARTS, len(rows))
+    PDB_TRIGRAM_ROWS = rows
+
+
+def _find_pdb_matches_by_trigram(needle: bytes):
+    """Finds the PDB IDs containing `needle` (at least 3 bytes long) using the
+    trigram index, so only IDs sharing every trigram of the query are checked."""
+    if PDB_TRIGRAM_KEYS is None:
+        _build_trigram_index()
+
+    postings = []
+    for i in range(len(needle) - 2):
+        key = int.from_bytes(needle[i : i + 3], "big")
+        j = int(np.searchsorted(PDB_TRIGRAM_KEYS, key))
+        if j == len(PDB_TRIGRAM_KEYS) or PDB_TRIGRAM_KEYS[j] != key:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        postings.append(
+            PDB_TRIGRAM_ROWS[PDB_TRIGRAM_STARTS[j] : PDB_TRIGRAM_STARTS[j + 1]]
+        )
+
+    postings.sort(key=len)
+    candidates = postings[0]
+    for posting in postings[1:]:
+        candidates = np.intersect1d(candidates, posting, assume_unique=True)
+
+    # Sharing every trigram doesn't guarantee a match, so verify each candidate.
+    width = ALL_PDB_IDS.itemsize
+    indices, positions = [], []
+    for idx in candidates.tolist():
+        start = idx * width
+        hit = PDB_BLOB.find(needle, start, start + int(PDB_ID_LENGTHS[idx]))
+        if hit != -1:
+            indices.append(idx)
+            positions.append(hit - start)
+
+    return np.array(indices, dtype=np.int64), np.array(positions, dtype=np.int64)
+
+
 @router.get("/search", response_model=PDBSearchResponse)
 async def search_pdb(
     request: Request,
@@ -89,7 +277,7 @@ async def search_pdb(
     """
     try:
         # Check if PDB data is loaded
-        if PDB_DATA is None:
+        if not PDB_DATA_LOADED:
             # Try to load the data if it's not already loaded
             if not load_pdb_data():
                 raise HTTPException(
@@ -100,33 +288,35 @@ async def search_pdb(
         # Prepare the search query
         query = query.lower()
 
-        # Find substring matches
-        matches = []
-        for pdb_id in ALL_PDB_IDS:
-            pdb_id_lower = pdb_id.lower()
-            if query in pdb_id_lower:
-                # Calculate position of match (for sorting)
-                position = pdb_id_lower.find(query)
-                matches.append((pdb_id, position))
-
-        # Sort by position (matches at the beginning come first)
-        matches.sort(key=lambda x: x[1])
+        # Find substring matches. The position of the match is used for sorting.
+        match_idx, positions = find_pdb_matches(query)
 
         # Calculate pagination
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
-        paginated_matches = matches[start_idx:end_idx]
 
-        # Extract just the PDB IDs
-        result_pdb_ids = [pdb_id for pdb_id, _ in paginated_matches]
+        # Sort by position (matches at the beginning come first), then by PDB ID
+        # between matches at the same position. Only the first end_idx
+        # matches are needed, so partially sort on a unique (position, index) key.
+        sort_keys = positions * len(ALL_PDB_IDS) + match_idx
+        if end_idx < len(sort_keys):
+            top = np.argpartition(sort_keys, end_idx - 1)[:end_idx]
+        else:
+            top = np.arange(len(sort_keys))
+        top = top[np.argsort(sort_keys[top])]
+        result_idx = match_idx[top[start_idx:]]
 
-        # Return the results
+        # Return the results. The IDs and sources come from our own cache, so the
+        # per-match models are built without re-validating them.
         return PDBSearchResponse(
             matches=[
-                PDB(pdb_id=pdb_id, source=PDB_TO_SOURCE[pdb_id])
-                for pdb_id in result_pdb_ids
+                PDB.model_construct(
+                    pdb_id=ALL_PDB_IDS[i].decode(),
+                    source=PDB_SOURCE_NAMES[PDB_SOURCE_CODES[i]],
+                )
+                for i in result_idx
             ],
-            total=len(matches),
+            total=len(match_idx),
         )
 
     except HTTPException:
@@ -149,126 +339,250 @@ async def get_pdb_info(
 
     This endpoint queries the RCSB PDB GraphQL API to get information about a specific PDB entry.
     """
+    return await fetch_pdb_info(pdb_id, get_http_session())
+
+
+async def fetch_pdb_info(
+    pdb_id: str, session: aiohttp.ClientSession
+) -> PDBInfoResponse:
+    """
+    Query the RCSB PDB GraphQL API for a PDB entry using the given session.
+
+    Raises:
+        HTTPException: If the PDB ID is unknown or RCSB has no data for it.
+    """
     try:
         # Normalize PDB ID
         pdb_id = pdb_id.lower()
 
         # Check if the PDB ID exists in our database
-        if PDB_DATA is None:
+        if not PDB_DATA_LOADED:
             if not load_pdb_data():
                 raise HTTPException(
                     status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
                     detail="PDB database could not be loaded",
                 )
 
-        if pdb_id not in PDB_TO_SOURCE:
+        if find_pdb_index(pdb_id.encode()) == -1:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
                 detail=f"PDB ID {pdb_id} not found in database",
             )
 
-        # Fetch details from RCSB GraphQL API
-        graphql_url = "https://data.rcsb.org/graphql"
-
-        # Construct GraphQL query
-        query = """
-        query GetPDBInfo($pdbId: String!) {
-          entry(entry_id: $pdbId) {
-            struct {
-              title
-            }
-            struct_keywords {
-              pdbx_keywords
-            }
-            polymer_entities {
-              rcsb_entity_source_organism {
-                scientific_name
-              }
-              rcsb_entity_host_organism {
-                scientific_name
-              }
-              entity_poly {
-                pdbx_seq_one_letter_code_can
-                rcsb_sample_sequence_length
-              }
-            }
-            rcsb_entry_info {
-              experimental_method
-              resolution_combined
-            }
-          }
-        }
-        """
+        # Known PDBs are served from the local metadata store without calling RCSB.
+        info = PDB_META.get(pdb_id)
+        if info is not None:
+            return info
+
+        return await get_cached_pdb_info(pdb_id, session)
 
-        # Make GraphQL request
-        response = requests.post(
-            graphql_url, json={"query": query, "variables": {"pdbId": pdb_id}}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Unexpected error retrieving PDB info: {e}")
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while retrieving PDB information. Please try again later.",
         )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail=f"PDB ID {pdb_id} not found in RCSB database",
-            )
 
-        result = response.json()
+# Persistent PDB metadata, pdb_id -> PDBInfoResponse. Loaded from PDB_META_PATH by
+# the API lifespan and filled from RCSB on a miss. Entry metadata doesn't change, so
+# entries never expire.
+PDB_META_PATH = os.getenv(
+    "PDB_META_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "pdb_meta.sqlite"),
+)
+PDB_META_FIELDS = ("molecule_name", "classification", "organism", "expression_system")
 
-        # Check for GraphQL errors
-        if "errors" in result:
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail=f"Error retrieving data for PDB ID {pdb_id}: {result['errors'][0]['message']}",
+
+def _connect_pdb_meta(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pdb_meta (pdb_id TEXT PRIMARY KEY, "
+        + ", ".join(f"{field} TEXT" for field in PDB_META_FIELDS)
+        + ")"
+    )
+    return conn
+
+
+def load_pdb_meta(path: str = PDB_META_PATH) -> Dict[str, PDBInfoResponse]:
+    """Loads every stored PDB metadata row into memory."""
+    try:
+        with closing(_connect_pdb_meta(path)) as conn:
+            rows = conn.execute(
+                f"SELECT pdb_id, {', '.join(PDB_META_FIELDS)} FROM pdb_meta"
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not load PDB metadata from {path}: {e}")
+        return {}
+
+    return {
+        row[0]: PDBInfoResponse.model_construct(
+            pdb_id=row[0], **dict(zip(PDB_META_FIELDS, row[1:]))
+        )
+        for row in rows
+    }
+
+
+def save_pdb_meta(info: PDBInfoResponse, path: str = PDB_META_PATH):
+    """Stores the metadata of a single PDB entry."""
+    try:
+        with closing(_connect_pdb_meta(path)) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO pdb_meta VALUES (?, "
+                f"{', '.join('?' * len(PDB_META_FIELDS))})",
+                (info.pdb_id, *(getattr(info, field) for field in PDB_META_FIELDS)),
             )
+    except sqlite3.Error as e:
+        logger.warning(f"Could not store PDB metadata for {info.pdb_id}: {e}")
+
 
-        # Extract data from GraphQL response
-        data = result.get("data", {}).get("entry", {})
-        if not data:
+PDB_META: Dict[str, PDBInfoResponse] = {}
+
+
+# RCSB lookups in flight, pdb_id -> lookup task. Concurrent requests for the same PDB
+# await the same task instead of each querying RCSB. Successful lookups land in
+# PDB_META, so nothing needs to stay here once a task is done.
+PDB_INFO_IN_FLIGHT: Dict[str, asyncio.Task] = {}
+
+
+async def get_cached_pdb_info(
+    pdb_id: str, session: aiohttp.ClientSession
+) -> PDBInfoResponse:
+    """Return the PDB info for `pdb_id`, joining an RCSB lookup already in flight."""
+    task = PDB_INFO_IN_FLIGHT.get(pdb_id)
+    if task is None:
+        task = asyncio.ensure_future(query_pdb_info(pdb_id, session))
+        PDB_INFO_IN_FLIGHT[pdb_id] = task
+        task.add_done_callback(lambda done: PDB_INFO_IN_FLIGHT.pop(pdb_id, None))
+
+    # Shield the shared lookup so one caller disconnecting doesn't cancel it for
+    # everyone else awaiting the same PDB.
+    return await asyncio.shield(task)
+
+
+# RCSB GraphQL endpoint and the query used to look up PDB entry details.
+RCSB_GRAPHQL_URL = "https://data.rcsb.org/graphql"
+RCSB_TIMEOUT = aiohttp.ClientTimeout(total=15)
+RCSB_PDB_INFO_QUERY = """
+query GetPDBInfo($pdbId: String!) {
+  entry(entry_id: $pdbId) {
+    struct {
+      title
+    }
+    struct_keywords {
+      pdbx_keywords
+    }
+    polymer_entities {
+      rcsb_entity_source_organism {
+        scientific_name
+      }
+      rcsb_entity_host_organism {
+        scientific_name
+      }
+      entity_poly {
+        pdbx_seq_one_letter_code_can
+        rcsb_sample_sequence_length
+      }
+    }
+    rcsb_entry_info {
+      experimental_method
+      resolution_combined
+    }
+  }
+}
+"""
+
+
+async def query_pdb_info(
+    pdb_id: str, session: aiohttp.ClientSession
+) -> PDBInfoResponse:
+    """Query the RCSB PDB GraphQL API for a PDB entry known to be in our database."""
+    # Make GraphQL request
+    async with session.post(
+        RCSB_GRAPHQL_URL,
+        json={"query": RCSB_PDB_INFO_QUERY, "variables": {"pdbId": pdb_id}},
+        timeout=RCSB_TIMEOUT,
+    ) as response:
+        if response.status != 200:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
-                detail=f"No data found for PDB ID {pdb_id}",
+                detail=f"PDB ID {pdb_id} not found in RCSB database",
             )
 
-        # Extract relevant information
-        struct_data = data.get("struct", {})
-        molecule_name = struct_data.get("title")
-        struct_keywords = data.get("struct_keywords", {})
-        classification = struct_keywords.get("pdbx_keywords")
-        print(struct_keywords)
-
-        # Extract organism information
-        polymer_entities = data.get("polymer_entities", [])
-        organism = None
-        expression_system = None
-
-        if polymer_entities and len(polymer_entities) > 0:
-            # Get organism from first entity
-            org_data = polymer_entities[0].get("rcsb_entity_source_organism", [])
-            if org_data and len(org_data) > 0:
-                organism = org_data[0].get("scientific_name")
-
-            # Get expression system from first entity
-            host_data = polymer_entities[0].get("rcsb_entity_host_organism", [])
-            if host_data and len(host_data) > 0:
-                expression_system = host_data[0].get("scientific_name")
-
-        # Construct and return the PDBInfoResponse
-        return PDBInfoResponse(
-            pdb_id=pdb_id,
-            molecule_name=molecule_name,
-            classification=classification,
-            organism=organism,
-            expression_system=expression_system,
+        result = await response.json()
+
+    # Check for GraphQL errors
+    if "errors" in result:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"Error retrieving data for PDB ID {pdb_id}: {result['errors'][0]['message']}",
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.exception(f"Unexpected error retrieving PDB info: {e}")
+    # Extract data from GraphQL response
+    data = result.get("data", {}).get("entry", {})
+    if not data:
         raise HTTPException(
-            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while retrieving PDB information. Please try again later.",
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"No data found for PDB ID {pdb_id}",
         )
 
+    # Extract relevant information
+    struct_data = data.get("struct", {})
+    molecule_name = struct_data.get("title")
+    struct_keywords = data.get("struct_keywords", {})
+    classification = struct_keywords.get("pdbx_keywords")
+
+    # Extract organism information
+    polymer_entities = data.get("polymer_entities", [])
+    organism = None
+    expression_system = None
+
+    if polymer_entities and len(polymer_entities) > 0:
+        # Get organism from first entity
+        org_data = polymer_entities[0].get("rcsb_entity_source_organism", [])
+        if org_data and len(org_data) > 0:
+            organism = org_data[0].get("scientific_name")
+
+        # Get expression system from first entity
+        host_data = polymer_entities[0].get("rcsb_entity_host_organism", [])
+        if host_data and len(host_data) > 0:
+            expression_system = host_data[0].get("scientific_name")
+
+    # Construct the PDBInfoResponse and keep it in the local metadata store
+    info = PDBInfoResponse(
+        pdb_id=pdb_id,
+        molecule_name=molecule_name,
+        classification=classification,
+        organism=organism,
+        expression_system=expression_system,
+    )
+    PDB_META[pdb_id] = info
+    await asyncio.to_thread(save_pdb_meta, info)
+    return info
+
+
+def _read_pdbe_download(temp_dir: str, pdb_id: str) -> str:
+    """Converts an rsynced PDBe `<pdb_id>.cif.gz` in `temp_dir` to PDB text and
+    removes the temporary files."""
+    # Decompress in-process instead of shelling out to gunzip.
+    gz_path = f"{temp_dir}/{pdb_id}.cif.gz"
+    cif_path = f"{temp_dir}/{pdb_id}.cif"
+    pdb_path = f"{temp_dir}/{pdb_id}.pdb"
+    with open(gz_path, "rb") as file:
+        cif_bytes = gzip.decompress(file.read())
+    with open(cif_path, "wb") as file:
+        file.write(cif_bytes)
+    os.remove(gz_path)
+
+    convert_cif_to_pdb(cif_file=cif_path, pdb_file=pdb_path)
+    with open(pdb_path, "r") as file:
+        pdb_text = file.read()
+    os.remove(cif_path)
+    os.remove(pdb_path)
+    return pdb_text
+
 
 @router.get("/pdb/{pdb_id}/file")
 async def get_pdb_file(
@@ -283,24 +597,27 @@ async def get_pdb_file(
         # Normalize PDB ID
         pdb_id = pdb_id.lower()
 
+        session = get_http_session()
+
         # First check S3 bucket
         s3_url = f"https://sn25.nyc3.digitaloceanspaces.com/pdb_files/{pdb_id}.pdb"
-        s3_response = requests.get(s3_url)
-        if s3_response.status_code == 200:
-            logger.info(f"Found PDB file {pdb_id} in S3 bucket")
-            return s3_response.text
+        # Only the status line and headers are read up front. The body is streamed
+        # only when the file exists, so a miss doesn't download anything.
+        async with session.get(s3_url) as s3_response:
+            if s3_response.status == 200:
+                logger.info(f"Found PDB file {pdb_id} in S3 bucket")
+                return await s3_response.text()
 
         # If not in S3, proceed with original download methods
         if input_source == "rcsb":
             url = f"https://files.rcsb.org/download/{pdb_id}.pdb"
-            r = requests.get(url)
-            if r.status_code == 200:
-                return r.text
-            else:
-                raise HTTPException(
-                    status_code=HTTPStatus.NOT_FOUND,
-                    detail=f"PDB file {pdb_id} not found in database.",
-                )
+            async with session.get(url) as r:
+                if r.status == 200:
+                    return await r.text()
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f"PDB file {pdb_id} not found in database.",
+            )
 
         elif input_source == "pdbe":
             # strip the string of the extension
@@ -309,8 +626,6 @@ async def get_pdb_file(
             if not os.path.exists(temp_dir):
                 os.makedirs(temp_dir)
 
-            unzip_command = ["gunzip", f"{temp_dir}/{pdb_id}.cif.gz"]
-
             rsync_command = [
                 "rsync",
                 "-rlpt",
@@ -321,19 +636,20 @@ async def get_pdb_file(
             ]
 
             try:
-                subprocess.run(rsync_command, check=True)
-                subprocess.run(unzip_command, check=True)
+                # Run rsync without blocking the event loop.
+                process = await asyncio.create_subprocess_exec(
+                    *rsync_command,
+                    stdout=asyncio.subprocess.DEVNULL,
+                )
+                returncode = await process.wait()
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, rsync_command)
+
                 logger.success(f"PDB file {pdb_id} downloaded successfully from PDBe.")
 
-                convert_cif_to_pdb(
-                    cif_file=f"{temp_dir}/{pdb_id}.cif",
-                    pdb_file=f"{temp_dir}/{pdb_id}.pdb",
-                )
-                with open(f"{temp_dir}/{pdb_id}.pdb", "r") as file:
-                    pdb_text = file.read()
-                os.remove(f"{temp_dir}/{pdb_id}.cif")
-                os.remove(f"{temp_dir}/{pdb_id}.pdb")
-                return pdb_text
+                # Decompressing, converting and reading the files is blocking I/O
+                # and CPU work, so it all runs in a worker thread.
+                return await asyncio.to_thread(_read_pdbe_download, temp_dir, pdb_id)
             except subprocess.CalledProcessError as e:
                 raise HTTPException(
                     status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -370,8 +686,15 @@ async def get_pdb_images(
         large_image_url = f"{base_url}/{pdb_id}_800.png"
 
         # Check if images exist
-        small_exists = requests.head(small_image_url).status_code == 200
-        large_exists = requests.head(large_image_url).status_code == 200
+        session = get_http_session()
+
+        async def image_exists(url: str) -> bool:
+            async with session.head(url) as response:
+                return response.status == 200
+
+        small_exists, large_exists = await asyncio.gather(
+            image_exists(small_image_url), image_exists(large_image_url)
+        )
 
         if not (small_exists or large_exists):
             raise HTTPException(
@@ -426,46 +749,67 @@ async def get_job_pool_status(
     elif status == "all":
         query = "SELECT * FROM jobs"
 
+    params = []
+
     # Add job_ids filter if provided
     if job_ids and len(job_ids) > 0:
         # Format the job_ids list for SQL IN clause
-        job_ids_str = "', '".join(job_ids)
+        placeholders = ", ".join("?" * len(job_ids))
+        params.extend(job_ids)
 
         # If there's already a WHERE clause, add AND
         if " WHERE " in query:
-            query += f" AND job_id IN ('{job_ids_str}')"
+            query += f" AND job_id IN ({placeholders})"
         else:
-            query += f" WHERE job_id IN ('{job_ids_str}')"
+            query += f" WHERE job_id IN ({placeholders})"
 
     # Add pdb_search filter if provided
     if pdb_search:
         # Normalize the search query to lowercase
         pdb_search = pdb_search.lower()
+        params.append(f"%{pdb_search}%")
 
         # Add LIKE clause for substring search on pdb_id
         if " WHERE " in query:
-            query += f" AND LOWER(pdb_id) LIKE '%{pdb_search}%'"
+            query += " AND LOWER(pdb_id) LIKE ?"
         else:
-            query += f" WHERE LOWER(pdb_id) LIKE '%{pdb_search}%'"
-
-    # Get total count for pagination
-    count_query = query.replace("SELECT *", "SELECT COUNT(*)")
-    total_results = query_gjp(count_query)
-    total = total_results[0]["COUNT(*)"] if total_results else 0
+            query += " WHERE LOWER(pdb_id) LIKE ?"
 
     # Calculate offset from page and page_size
     offset = (page - 1) * page_size
 
-    # Add pagination
-    query += f" ORDER BY created_at DESC LIMIT {page_size} OFFSET {offset}"
+    # Add pagination. The window count returns the total number of matching jobs
+    # on every row, so the filter only runs once.
+    page_query = query.replace("SELECT *", "SELECT *, COUNT(*) OVER () AS total_count")
+    page_query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+    results = query_gjp(page_query, [*params, page_size, offset])
+
+    # Get total count for pagination
+    if results and results[0]:
+        total = results[0]["total_count"]
+    elif offset > 0:
+        # A page past the end has no rows to carry the count, so count separately.
+        count_query = query.replace("SELECT *", "SELECT COUNT(*)")
+        total_results = query_gjp(count_query, params)
+        total = total_results[0]["COUNT(*)"] if total_results else 0
+    else:
+        total = 0
+    # event and s3_links payloads repeat across rows, so parse each distinct one once.
+    parsed_json = {}
+
+    def load_json(raw: Optional[str]) -> dict:
+        if not raw:
+            return {}
+        if raw not in parsed_json:
+            parsed_json[raw] = json.loads(raw)
+        return parsed_json[raw]
 
-    results = query_gjp(query)
     jobs = []
     for result in results:
         if not result:
             continue
 
-        event = json.loads(result.get("event", {}))
+        event = load_json(result.get("event"))
         # Determine job status based on active and event data
         if result["active"] == "1":
             job_status = "active"
@@ -485,7 +829,7 @@ async def get_job_pool_status(
             priority=result["priority"],
             validator_hotkey=result["validator_hotkey"],
             best_hotkey=result["best_hotkey"],
-            s3_links=json.loads(result["s3_links"]),
+            s3_links=load_json(result["s3_links"]),
             status=job_status,
         )
         jobs.append(job)
@@ -494,6 +838,44 @@ async def get_job_pool_status(
     return resp
 
 
+async def fetch_text(session: aiohttp.ClientSession, url: str) -> str:
+    """Download the body of `url` as text."""
+    async with session.get(url) as response:
+        return await response.text()
+
+
+async def fetch_sampled_energies(
+    session: aiohttp.ClientSession, url: str, every: int = 500
+) -> Tuple[list, float]:
+    """Stream a miner's log file and keep every `every`th step.
+
+    The log file is a CSV with a header row, the first two columns being the step and
+    the energy. Lines are parsed as they arrive, so the whole file is never held in
+    memory.
+
+    Returns:
+        Tuple[list, float]: The sampled {step, energy} objects and the final energy.
+    """
+    energy_data = []
+    final_energy = None
+    row = 0
+    async with session.get(url) as response:
+        await response.content.readline()  # header
+        async for line in response.content:
+            line = line.strip()
+            if not line:
+                continue
+            step, energy = line.split(b",", 2)[:2]
+            final_energy = float(energy)
+            if row % every == 0:
+                energy_data.append({"step": int(float(step)), "energy": final_energy})
+            row += 1
+
+    if final_energy is None:
+        raise ValueError(f"Log file {url} has no energy data")
+    return energy_data, final_energy
+
+
 @router.get("/job_pool/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: str,
@@ -505,8 +887,8 @@ async def get_job(
     """
     Retrieve a specific job by its ID.
     """
-    query = f"SELECT * FROM jobs WHERE job_id = '{job_id}'"
-    results = query_gjp(query)
+    query = "SELECT * FROM jobs WHERE job_id = ?"
+    results = query_gjp(query, [job_id])
     if not results:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
@@ -531,12 +913,14 @@ async def get_job(
     # Parse hotkeys and create miners list with energy data
     hotkeys = json.loads(job.get("hotkeys", "[]"))
     uids = event.get("uids", [])
+    processed_uids = event.get("processed_uids", [])
     reasons = event.get("reason", [])
     output_links = event.get("output_links", [])
 
     if mock_miners:
         # Generate mock miners data
         miners = []
+        log_file_links = []
         num_miners = random.randint(1, 5)  # Random number of miners between 1 and 5
 
         for i in range(num_miners):
@@ -546,22 +930,24 @@ async def get_job(
             # Generate random number of steps between 5 and 20
             num_steps = random.randint(10000, 500000)
 
-            # Generate energy values that decrease logarithmically
-            energy_values = []
+            # Energy decreases logarithmically:
+            # energy = start_energy + (min_energy - start_energy) * log(1 + step/num_steps)
             start_energy = random.uniform(-1000, -10000)  # Start with random energy
             min_energy = (
                 start_energy * 1.5
             )  # Target minimum energy (50% lower than start)
 
-            for step in range(num_steps):
-                # Logarithmic decrease: energy = start_energy + (min_energy - start_energy) * log(1 + step/num_steps)
-                progress = step / num_steps
-                current_energy = start_energy + (min_energy - start_energy) * math.log(
-                    1 + progress
-                )
-                energy_values.append({"step": step, "energy": current_energy})
+            steps = np.arange(num_steps, dtype=np.int64)
+            energies = start_energy + (min_energy - start_energy) * np.log1p(
+                steps / num_steps
+            )
+            # Only every 10000th step is returned, so build dicts for those alone.
+            mock_energy = [
+                {"step": int(step), "energy": float(energy)}
+                for step, energy in zip(steps[::10000], energies[::10000])
+            ]
+            current_energy = float(energies[-1])
 
-            mock_energy = energy_values[::10000]  # Sample every 500th step
             miners.append(
                 {
                     "uid": mock_uid,
@@ -571,35 +957,43 @@ async def get_job(
                 }
             )
     else:
-        # Original logic for real miners
-        miners = [
-            {"uid": str(miner_uid), "hotkey": miner_hotkey, "energy": []}
-            for miner_uid, miner_hotkey, reason in zip(uids, hotkeys, reasons)
-            if reason != ""
-        ]
-
-        for miner, output_link in zip(miners, output_links):
-            log_file_link = output_link.get("log_file_path", "")
-            log_file_response = requests.get(log_file_link)
-            log_file_text = log_file_response.text
-            data = io.StringIO(log_file_text)
-            df = pd.read_csv(data)
-            # Convert DataFrame to list of {step, energy} objects
-            energy_data = []
-            for step, energy in zip(df.iloc[:, 0], df.iloc[:, 1]):
-                energy_data.append({"step": int(step), "energy": float(energy)})
-            miner["energy"] = energy_data[::500]  # Sample every 500th step
-            miner["final_energy"] = df.iloc[-1, 1]
-    miners = [Miner(**miner) for miner in miners]
+        # reason and output_links line up with processed_uids, while the job's
+        # hotkeys line up with uids. Filter all of them in a single pass so each
+        # miner keeps its own hotkey and log file.
+        uid_to_hotkey = dict(zip(uids, hotkeys))
+        miners, log_file_links = [], []
+        for miner_uid, reason, output_link in zip(
+            processed_uids, reasons, output_links
+        ):
+            if reason == "":
+                continue
+            miners.append(
+                {
+                    "uid": str(miner_uid),
+                    "hotkey": uid_to_hotkey.get(miner_uid, ""),
+                    "energy": [],
+                }
+            )
+            log_file_links.append(output_link.get("log_file_path", ""))
+
     # Parse s3 links for pdb data
     s3_links = json.loads(job.get("s3_links", "{}"))
     pdb_link = s3_links.get("pdb", "")
-    if pdb_link:
-        pdb_data = requests.get(pdb_link).text
-    else:
-        pdb_data = ""
 
-    pdb_info = await get_pdb_info(job.get("pdb_id", ""))
+    # Fetch the miners' log files, the pdb file and the pdb info concurrently.
+    session = get_http_session()
+    log_energies, pdb_data, pdb_info = await asyncio.gather(
+        asyncio.gather(
+            *(fetch_sampled_energies(session, link) for link in log_file_links)
+        ),
+        fetch_text(session, pdb_link) if pdb_link else asyncio.sleep(0, ""),
+        fetch_pdb_info(job.get("pdb_id", ""), session),
+    )
+
+    for miner, (energy_data, final_energy) in zip(miners, log_energies):
+        miner["energy"] = energy_data
+        miner["final_energy"] = final_energy
+    miners = [Miner(**miner) for miner in miners]
 
     return JobResponse(
         pdb_id=job.get("pdb_id", ""),
@@ -1,11 +1,36 @@
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 
+import aiohttp
 from fastapi import UploadFile, File
 from folding_api.schemas import FoldingParams
 import requests
 from folding_api.vars import epistula, subtensor_service, bt_config
 
+# Shared session so rqlite reads reuse pooled keep-alive connections instead of
+# opening a new TCP connection per query.
+gjp_session = requests.Session()
+
+# Shared aiohttp session for outbound calls made from async endpoints. It is created
+# lazily because a ClientSession has to be created inside the running event loop.
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30)
+        )
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared aiohttp session if it was created."""
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+
 
 async def make_request(
     address: str,
@@ -45,8 +70,13 @@ def response_to_dict(response) -> list[dict]:
     return data
 
 
-def query_gjp(query: str) -> list[dict]:
-    response = requests.get(
-        f"http://{bt_config.gjp_address}/db/query", params={"q": query}
+def query_gjp(query: str, params: Sequence[Any] = ()) -> list[dict]:
+    """Run a read query against the GJP rqlite node.
+
+    Values for `?` placeholders in `query` are passed separately in `params`, so they
+    are bound by the database rather than interpolated into the SQL.
+    """
+    response = gjp_session.post(
+        f"http://{bt_config.gjp_address}/db/query", json=[[query, *params]]
     )
     return response_to_dict(response)
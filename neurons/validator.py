@@ -1,20 +1,33 @@
 # The MIT License (MIT)
 # Copyright © 2024 Macrocosmos
 
-from collections import defaultdict
 import os
+import ast
+import json
 import time
+import random
+import shutil
+import signal
 import asyncio
-import traceback
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import netaddr
 import requests
-import torch
 import numpy as np
-import pandas as pd
 from async_timeout import timeout
 import tenacity
 
@@ -38,7 +51,10 @@ from folding.utils.s3_utils import (
 
 from folding.protocol import JobSubmissionSynapse
 from folding.utils.ops import get_response_info
-from folding.validators.reward import run_evaluation_validation_pipeline
+from folding.validators.reward import (
+    run_evaluation_validation_pipeline,
+    start_evaluation,
+)
 from folding.validators.forward import create_new_challenge
 from folding.validators.protein import Protein
 from folding.registries.miner_registry import MinerRegistry
@@ -49,6 +65,12 @@ import pickle
 
 load_dotenv()
 
+# Maximum number of output files uploaded to S3 at once when a job finishes.
+MAX_CONCURRENT_UPLOADS = 16
+
+# The validator restarts if it has not created a job for this many seconds.
+MAX_SECONDS_WITHOUT_JOBS = 12 * 60 * 60
+
 
 class Validator(BaseValidatorNeuron):
     """
@@ -95,6 +117,13 @@ class Validator(BaseValidatorNeuron):
         self.sync()
 
         self.store = SQLiteJobStore()
+
+        # Miner responses are evaluated on their own pool so a large batch can't
+        # starve the default executor used for S3 and chain I/O.
+        self.evaluation_executor = ThreadPoolExecutor(
+            max_workers=self.config.neuron.max_concurrent_evaluations,
+            thread_name_prefix="evaluation",
+        )
         self.wandb_run_start = None
         self.RSYNC_EXCEPTION_COUNT = 0
 
@@ -107,7 +136,13 @@ class Validator(BaseValidatorNeuron):
             else datetime.now(timezone.utc)
         )
 
-        self.last_time_created_jobs = datetime.now(timezone.utc)
+        # Loop (monotonic) time, so the staleness check is unaffected by clock changes.
+        self.last_time_created_jobs = self.loop.time()
+        # Set whenever a job is created, so monitor_validator can restart its deadline.
+        self._jobs_created = asyncio.Event()
+        # Blocks without setting weights before check_weights_set restarts the
+        # validator. Fixed at startup so a config reload can't move it mid-run.
+        self._max_block_gap = 3 * self.config.neuron.epoch_length
 
         if not self.config.s3.off:
             try:
@@ -126,6 +161,20 @@ class Validator(BaseValidatorNeuron):
         self._organic_api_pipe = None
         self._organic_api_process = None
 
+        # Cached by start_organic_api so that its retries don't repeat finished steps.
+        self._external_ip: Optional[str] = None
+        self._organic_api_commitment: Optional[str] = None
+
+        # Long-running tasks started by the validator, cancelled in __aexit__.
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Cleanups registered in __aenter__ and run once by __aexit__.
+        self._exit_stack = AsyncExitStack()
+        self._shutdown_started = False
+
+        # Job events waiting to be logged by _log_consumer.
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
     async def run_step(
         self,
         protein: Protein,
@@ -163,29 +212,60 @@ class Validator(BaseValidatorNeuron):
         system_config = protein.system_config.to_dict()
         system_config["seed"] = None  # We don't want to pass the seed to miners.
 
-        # Make calls to the network with the prompt - this is synchronous.
+        # Sign every miner's upload URL in one worker thread with a single S3 client,
+        # so the signing doesn't stall the event loop before the calls go out.
+        presigned_urls = await asyncio.to_thread(
+            self.handler.generate_presigned_urls,
+            miner_hotkeys=hotkeys,
+            pdb_id=protein.pdb_id,
+            file_name="trajectory.dcd",
+            method="put_object",
+            expires_in=int(timeout),
+        )
+
+        async def call_miner(idx: int) -> Tuple[int, JobSubmissionSynapse]:
+            response = await self.dendrite.call(
+                target_axon=axons[idx],
+                synapse=JobSubmissionSynapse(
+                    pdb_id=protein.pdb_id,
+                    job_id=job_id,
+                    presigned_url=presigned_urls[idx],
+                ),
+                timeout=timeout,
+                deserialize=True,
+            )
+            return idx, response
+
+        # Make calls to the network with the prompt. When the evaluation pool has
+        # more than one worker, each response is queued for evaluation as soon as it
+        # arrives, while slower miners are still replying. With a single worker the
+        # evaluations start once every miner has replied, as they always have.
         logger.info("⏰ Waiting for miner responses ⏰")
-        responses = await asyncio.gather(
-            *[
-                self.dendrite.call(
-                    target_axon=axon,
-                    synapse=JobSubmissionSynapse(
-                        pdb_id=protein.pdb_id,
-                        job_id=job_id,
-                        presigned_url=self.handler.generate_presigned_url(
-                            miner_hotkey=hotkey,
-                            pdb_id=protein.pdb_id,
-                            file_name="trajectory.dcd",
-                            method="put_object",
-                            expires_in=int(timeout),
-                        ),
-                    ),
-                    timeout=timeout,
-                    deserialize=True,
+        evaluate_early = self.config.neuron.max_concurrent_evaluations > 1
+        responses: List[JobSubmissionSynapse] = [None] * len(uids)
+        evaluations: List[asyncio.Future] = [None] * len(uids)
+        try:
+            for next_response in asyncio.as_completed(
+                [call_miner(idx) for idx in range(len(uids))]
+            ):
+                idx, response = await next_response
+                responses[idx] = response
+                if not evaluate_early:
+                    continue
+                evaluations[idx] = start_evaluation(
+                    protein,
+                    response,
+                    uids[idx],
+                    job_type,
+                    self.handler,
+                    self.evaluation_executor,
                 )
-                for axon, hotkey in zip(axons, hotkeys)
-            ]
-        )
+        except BaseException:
+            # Drop the evaluations that haven't started yet.
+            for evaluation in evaluations:
+                if evaluation is not None:
+                    evaluation.cancel()
+            raise
 
         response_info = get_response_info(responses=responses)
 
@@ -210,6 +290,7 @@ class Validator(BaseValidatorNeuron):
             miner_registry=self.miner_registry,
             job_type=job_type,
             axons=axons_dict,
+            evaluations=evaluations if evaluate_early else None,
         )
 
         logger.info(f"Finished run_evaluation_validation_pipeline for {protein.pdb_id}")
@@ -350,12 +431,13 @@ class Validator(BaseValidatorNeuron):
 
             logger.success("Job was uploaded successfully!")
 
-            self.last_time_created_jobs = datetime.now(timezone.utc)
+            self.last_time_created_jobs = self.loop.time()
+            self._jobs_created.set()
 
             # TODO: return job_id
             return True
         except Exception as e:
-            logger.warning(f"Error uploading job: {traceback.format_exc()}")
+            logger.opt(exception=True).warning("Error uploading job")
             job_event["job_id"] = None
 
             return False
@@ -368,38 +450,46 @@ class Validator(BaseValidatorNeuron):
             k (int): The number of jobs create and distribute to miners.
         """
 
+        # Read the pool's pdbs once and add each new job's pdb locally, rather than
+        # re-reading the whole table for every job.
+        exclude_pdbs = set(self.store.get_all_pdbs())
+
         # Deploy K number of unique pdb jobs, where each job gets distributed to self.config.neuron.sample_size miners
         for ii in range(k):
             logger.info(f"Adding job: {ii+1}/{k}")
 
-            # This will change on each loop since we are submitting a new pdb to the batch of miners
-            exclude_pdbs = self.store.get_all_pdbs()
             job_event: Dict = await create_new_challenge(self, exclude=exclude_pdbs)
 
-            await self.add_job(job_event=job_event)
+            if await self.add_job(job_event=job_event):
+                exclude_pdbs.add(job_event["pdb_id"])
             await asyncio.sleep(0.01)
 
     def credibility_pipeline(self, job: Job):
         """
         Run the credibility pipeline to update the uids inside of the job.
         """
-        for uid, reason in zip(job.event["processed_uids"], job.event["reason"]):
-            # jobs are "skipped" when they are spot checked
-            if reason == "skip":
-                continue
+        uids = np.asarray(job.event["processed_uids"], dtype=np.int64)
+        reasons = np.asarray(job.event["reason"], dtype=str)
 
-            # If there is an exploit on the cpt file detected via the state-checkpoint, reduce score.
-            if reason == "state-checkpoint":
-                logger.warning(
-                    f"Reducing uid {uid} score, State-checkpoint check failed."
-                )
-                self.scores[uid] = 0.5 * self.scores[uid]
-
-            credibility = [0.0] if reason != "valid" else [1.0]
-            self.miner_registry.add_credibilities(
-                miner_uid=uid, task=job.job_type, credibilities=credibility
+        # If there is an exploit on the cpt file detected via the state-checkpoint, reduce score.
+        checkpoint_uids = uids[reasons == c.REASON_STATE_CHECKPOINT].tolist()
+        if checkpoint_uids:
+            logger.warning(
+                f"Reducing uids {checkpoint_uids} score, State-checkpoint check failed."
             )
-            self.miner_registry.update_credibility(miner_uid=uid, task=job.job_type)
+            self.scores[checkpoint_uids] *= 0.5
+
+        # jobs are "skipped" when they are spot checked
+        scored = reasons != c.REASON_SKIP
+        scored_uids = uids[scored].tolist()
+        credibilities = np.where(reasons[scored] == c.REASON_VALID, 1.0, 0.0).tolist()
+
+        self.miner_registry.add_credibilities_bulk(
+            miner_uids=scored_uids, task=job.job_type, credibilities=credibilities
+        )
+        self.miner_registry.update_credibilities(
+            miner_uids=scored_uids, task=job.job_type
+        )
 
     async def update_job(self, job: Job):
         """Updates the job status based on the event information
@@ -409,7 +499,8 @@ class Validator(BaseValidatorNeuron):
         """
 
         apply_pipeline = False
-        energies = torch.Tensor(job.event["energies"])
+        # float32 matches the precision the reward pipeline has always used.
+        energies = np.asarray(job.event["energies"], dtype=np.float32)
 
         if len(job.event["processed_uids"]) > 0:
             try:
@@ -417,8 +508,8 @@ class Validator(BaseValidatorNeuron):
             except Exception as e:
                 logger.error(f"Error running the credibility_pipeline: {e}")
 
-        best_index = np.argmin(energies)
-        best_loss = energies[best_index].item()  # item because it's a torch.tensor
+        best_index = int(energies.argmin())
+        best_loss = float(energies[best_index])
         best_hotkey = job.hotkeys[best_index]
 
         await job.update(
@@ -427,7 +518,7 @@ class Validator(BaseValidatorNeuron):
         )
 
         # If no miners respond appropriately, the energies will be all zeros
-        if (energies == 0).all():
+        if not energies.any():
             # All miners not responding but there is at least ONE miner that did in the past. Give them rewards.
             if job.best_loss < 0:
                 apply_pipeline = True
@@ -456,25 +547,28 @@ class Validator(BaseValidatorNeuron):
                 f"All energies zero for job {job.pdb_id} and job has never been updated... Skipping"
             )
 
-        async def prepare_event_for_logging(event: Dict):
-            for key, value in event.items():
-                if isinstance(value, pd.Timedelta):
-                    event[key] = value.total_seconds()
-            return event
-
         event = job.model_dump()
         simulation_event = event.pop("event")  # contains information from hp search
         merged_events = simulation_event | event  # careful: this overwrites.
 
-        event = await prepare_event_for_logging(merged_events)
+        # Timedeltas (pd.Timedelta subclasses timedelta) are logged as seconds.
+        for key, value in merged_events.items():
+            if isinstance(value, timedelta):
+                merged_events[key] = value.total_seconds()
+        event = merged_events
 
-        # If the job is finished, remove the pdb directory
         pdb_location = None
         folded_protein_location = None
-        protein = await Protein.from_job(job=job, config=self.config.protein)
 
-        if protein is not None:
-            if job.active is True:
+        # The protein is only needed for the file locations logged for active jobs.
+        # Without any energies there is nothing to visualise, and finished jobs only
+        # need their directory removed, which is done by path below.
+        needs_protein = job.active is True and apply_pipeline
+        if needs_protein:
+            protein = await Protein.from_job(job=job, config=self.config.protein)
+            if protein is None:
+                logger.error(f"Protein.from_job returns NONE for protein {job.pdb_id}")
+            else:
                 if event["updated_count"] == 1:
                     pdb_location = protein.pdb_location
 
@@ -483,24 +577,20 @@ class Validator(BaseValidatorNeuron):
                     protein.miner_data_directory, f"{protein.pdb_id}_folded.pdb"
                 )
 
-        else:
-            logger.error(f"Protein.from_job returns NONE for protein {job.pdb_id}")
-
-        # Remove these keys from the log because they polute the terminal.
-        log_event(
-            self,
-            event=event,
-            pdb_location=pdb_location,
-            folded_protein_location=folded_protein_location,
-        )
+        # Logging to wandb is slow, so hand the event to the log consumer. A copy is
+        # queued because keys are popped from merged_events below.
+        try:
+            self._log_queue.put_nowait(
+                (dict(event), pdb_location, folded_protein_location)
+            )
+        except asyncio.QueueFull:
+            logger.warning(f"Log queue is full, dropping event for {job.pdb_id}")
 
         # Only upload the best .cpt files to S3 if the job is inactive and there are processed uids.
         if job.active is False and len(job.event["processed_uids"]) > 0:
-            output_links = []
-            for _ in range(len(job.event["files"])):
-                output_links.append(defaultdict(str))
-
+            output_links: List[Dict[str, str]] = []
             best_cpt_files = []
+            uploads = []
             output_time = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
 
             for idx, (uid, files) in enumerate(
@@ -514,25 +604,39 @@ class Validator(BaseValidatorNeuron):
                     self.metagraph.hotkeys[uid][:8],
                     output_time,
                 )
+                # The file types differ between miners (intermediate checkpoints, pdb
+                # files), so each miner gets one dict with a link slot per file, left
+                # empty for files that were not produced.
+                output_links.append(dict.fromkeys(files, ""))
                 for file_type, file_path in files.items():
                     if file_type == "best_cpt":
                         best_cpt_files.append(file_path)
-                    # If the best_cpt_file is empty, we will append an empty string to the output_links list.
                     if file_path == "":
-                        output_links[idx][file_type] = ""
                         continue
 
-                    key = self.handler.put(
+                    uploads.append((idx, file_type, file_path, location))
+
+            # Upload all files concurrently, bounded so a large job doesn't open a
+            # connection per file at once.
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+            async def upload(file_path: str, location: str) -> str:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self.handler.put,
                         file_path=file_path,
                         location=location,
                         public=True,
                     )
-                    output_link = os.path.join(
-                        self.handler.output_url,
-                        key,
-                    )
 
-                    output_links[idx][file_type] = output_link
+            keys = await asyncio.gather(
+                *(upload(file_path, location) for _, _, file_path, location in uploads)
+            )
+            for (idx, file_type, _, _), key in zip(uploads, keys):
+                output_links[idx][file_type] = os.path.join(
+                    self.handler.output_url,
+                    key,
+                )
 
             job.best_cpt_links = best_cpt_files
             job.event["output_links"] = output_links
@@ -561,8 +665,9 @@ class Validator(BaseValidatorNeuron):
                 logger.warning(f"Missing key in pop: {to_pop}")
                 continue
 
-        if protein is not None and job.active is False:
-            protein.remove_pdb_directory()
+        # If the job is finished, remove the pdb directory
+        if job.active is False:
+            shutil.rmtree(Protein.get_pdb_directory(job.pdb_id), ignore_errors=True)
             logger.success(f"Merged event for {job.pdb_id}: {merged_events}")
 
     async def create_synthetic_jobs(self):
@@ -603,7 +708,7 @@ class Validator(BaseValidatorNeuron):
                     )
 
             except Exception as e:
-                logger.error(f"Error in create_jobs: {traceback.format_exc()}")
+                logger.exception("Error in create_jobs")
 
             await asyncio.sleep(self.config.neuron.synthetic_job_interval)
 
@@ -636,19 +741,24 @@ class Validator(BaseValidatorNeuron):
                         continue
 
                     if isinstance(job.event, str):
-                        job.event = eval(job.event)  # if str, convert to dict.
+                        # if str, convert to dict. Events are stored as JSON, but
+                        # older ones may hold a Python dict repr.
+                        try:
+                            job.event = json.loads(job.event)
+                        except json.JSONDecodeError:
+                            job.event = ast.literal_eval(job.event)
 
                     job.event.update(job_event)
-                    job.hotkeys = [
-                        self.metagraph.hotkeys[uid] for uid in job.event["uids"]
-                    ]
+                    job.hotkeys = self._hotkeys_np[
+                        np.asarray(job.event["uids"], dtype=np.int64)
+                    ].tolist()
                     # Determine the status of the job based on the current energy and the previous values (early stopping)
                     # Update the DB with the current status
                     await self.update_job(job=job)
                 logger.info(f"step({self.step}) block({self.block})")
 
             except Exception as e:
-                logger.error(f"Error in update_jobs: {traceback.format_exc()}")
+                logger.exception("Error in update_jobs")
 
             self.step += 1
 
@@ -683,7 +793,7 @@ class Validator(BaseValidatorNeuron):
                 continue
 
             await self.update_scores(
-                rewards=torch.Tensor(inactive_job.computed_rewards),
+                rewards=np.asarray(inactive_job.computed_rewards, dtype=np.float32),
                 uids=inactive_job.event["uids"],
             )
             await asyncio.sleep(0.01)
@@ -695,23 +805,32 @@ class Validator(BaseValidatorNeuron):
     async def start_organic_api(self):
         try:
             logger.info("Starting organic API")
-            external_ip = requests.get("https://checkip.amazonaws.com").text.strip()
-            netaddr.IPAddress(external_ip)
-            previous_commit = self.subtensor.get_commitment(
-                self.config.netuid, self.uid
+            if self._external_ip is None:
+                external_ip = requests.get(
+                    "https://checkip.amazonaws.com", timeout=5
+                ).text.strip()
+                netaddr.IPAddress(external_ip)
+                self._external_ip = external_ip
+            commitment = (
+                f"http://{self._external_ip}:{self.config.neuron.organic_api.port}"
             )
-            logger.info(f"Previous commitment: {previous_commit}")
-            commitment = f"http://{external_ip}:{self.config.neuron.organic_api.port}"
-
-            if previous_commit != commitment:
-                serve_success = self.subtensor.commit(
-                    wallet=self.wallet,
-                    netuid=self.config.netuid,
-                    data=commitment,
+
+            if self._organic_api_commitment != commitment:
+                previous_commit = self.subtensor.get_commitment(
+                    self.config.netuid, self.uid
                 )
-                logger.debug(f"Serve success: {serve_success}")
-            else:
-                logger.info("No need to commit again")
+                logger.info(f"Previous commitment: {previous_commit}")
+
+                if previous_commit != commitment:
+                    serve_success = self.subtensor.commit(
+                        wallet=self.wallet,
+                        netuid=self.config.netuid,
+                        data=commitment,
+                    )
+                    logger.debug(f"Serve success: {serve_success}")
+                else:
+                    logger.info("No need to commit again")
+                self._organic_api_commitment = commitment
 
             # Start the API in a separate process instead of the same process
             (
@@ -720,9 +839,11 @@ class Validator(BaseValidatorNeuron):
             ) = start_organic_api_in_process(self.config)
 
             # Start task to handle pipe communication
-            self.loop.create_task(self._handle_organic_api_pipe())
+            self.start_background_task(
+                self._handle_organic_api_pipe(), name="organic_api_pipe"
+            )
         except Exception as e:
-            logger.error(f"Error in start_organic_api: {traceback.format_exc()}")
+            logger.exception("Error in start_organic_api")
             raise e
 
     async def _handle_organic_api_pipe(self):
@@ -730,29 +851,60 @@ class Validator(BaseValidatorNeuron):
         Handle jobs received from the organic API pipe.
         """
         logger.info("Starting organic API pipe handler")
+
+        # Wake up when the pipe becomes readable instead of polling it on a timer.
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        fd = self._organic_api_pipe.fileno()
+        loop.add_reader(fd, readable.set)
+
+        try:
+            while True:
+                await readable.wait()
+                readable.clear()
+                try:
+                    while self._organic_api_pipe.poll():
+                        # Get the data
+                        serialized_items = self._organic_api_pipe.recv_bytes()
+                        # Unpickle in a worker thread so a large batch doesn't
+                        # stall the event loop.
+                        items = await loop.run_in_executor(
+                            None, pickle.loads, serialized_items
+                        )
+
+                        # Process each item
+                        logger.info(f"Received {len(items)} jobs from organic API")
+                        for item in items:
+                            self._organic_scoring._organic_queue.add(item)
+
+                        # Log that we've added the items to the queue
+                        logger.info(f"Added {len(items)} jobs to organic queue")
+                except EOFError:
+                    logger.warning("Organic API pipe closed, stopping pipe handler")
+                    return
+                except Exception as e:
+                    logger.exception("Error handling organic API pipe")
+        finally:
+            loop.remove_reader(fd)
+
+    async def _log_consumer(self):
+        """Logs the job events queued by update_job, one at a time."""
+        logger.info("Starting log consumer.")
         while True:
+            event, pdb_location, folded_protein_location = await self._log_queue.get()
             try:
-                # Check if there's data in the pipe
-                if self._organic_api_pipe and self._organic_api_pipe.poll():
-                    # Get the data
-                    serialized_items = self._organic_api_pipe.recv()
-                    items = pickle.loads(serialized_items)
-
-                    # Process each item
-                    logger.info(f"Received {len(items)} jobs from organic API")
-                    for item in items:
-                        self._organic_scoring._organic_queue.add(item)
-
-                    # Log that we've added the items to the queue
-                    logger.info(f"Added {len(items)} jobs to organic queue")
-
-                # Sleep before checking again
-                await asyncio.sleep(0.1)
-            except Exception as e:
-                logger.error(
-                    f"Error handling organic API pipe: {traceback.format_exc()}"
+                # wandb init, logging and file saves block, so run them off the event loop.
+                await asyncio.to_thread(
+                    log_event,
+                    self,
+                    event=event,
+                    pdb_location=pdb_location,
+                    folded_protein_location=folded_protein_location,
                 )
-                await asyncio.sleep(1)
+            except Exception as e:
+                logger.exception("Error in _log_consumer")
+            finally:
+                self._log_queue.task_done()
 
     async def reward_loop(self):
         logger.info("Starting reward loop.")
@@ -761,7 +913,7 @@ class Validator(BaseValidatorNeuron):
                 await asyncio.sleep(60)
                 await self.read_and_update_rewards()
             except Exception as e:
-                logger.error(f"Error in reward_loop: {traceback.format_exc()}")
+                logger.exception("Error in reward_loop")
 
     async def sync_loop(self):
         logger.info("Starting sync loop.")
@@ -770,40 +922,188 @@ class Validator(BaseValidatorNeuron):
             try:
                 await asyncio.sleep(self.config.neuron.epoch_length * seconds_per_block)
                 self.sync()
+                # last_update only moves when the metagraph is synced, so this is the
+                # point where the weight-setting check can change.
+                await self.check_weights_set()
             except Exception as e:
-                logger.error(f"Error in sync_loop: {traceback.format_exc()}")
+                logger.exception("Error in sync_loop")
+
+    async def check_weights_set(self):
+        """Restarts the validator if it hasn't set weights in 3 epochs."""
+        # Metagraph attributes can be backed by chain queries, so read them in a
+        # worker thread rather than on the event loop.
+        block, last_update = await asyncio.to_thread(
+            lambda: (self.metagraph.block, self.metagraph.neurons[self.uid].last_update)
+        )
+        block_difference = block - last_update
+        if block_difference > self._max_block_gap:
+            logger.error(
+                f"Haven't set blocks in {block_difference} blocks. Restarting validator."
+            )
+            self.should_exit = True
 
     async def monitor_validator(self):
+        """Restarts the validator if no jobs are created for MAX_SECONDS_WITHOUT_JOBS.
+
+        Instead of polling, this waits until the deadline and starts over whenever a
+        job is created before it.
+        """
         while True:
-            await asyncio.sleep(3600)
-            # if no jobs have been created in the last 12 hours, shutdown the validator
-            if (datetime.now() - self.last_time_created_jobs).seconds > 43200:
+            self._jobs_created.clear()
+            elapsed = self.loop.time() - self.last_time_created_jobs
+            try:
+                await asyncio.wait_for(
+                    self._jobs_created.wait(),
+                    timeout=max(MAX_SECONDS_WITHOUT_JOBS - elapsed, 0),
+                )
+            except asyncio.TimeoutError:
                 logger.error(
                     "No jobs have been created in the last 12 hours. Restarting validator."
                 )
                 self.should_exit = True
+                return
+
+    async def stop_organic_api(self):
+        """Terminates the organic API process if it exists, killing it after 5s."""
+        if self._organic_api_process and self._organic_api_process.is_alive():
+            logger.info("Terminating organic API process")
+            self._organic_api_process.terminate()
+            # join blocks, so wait for the process in a worker thread.
+            await asyncio.to_thread(self._organic_api_process.join, 5)
+            if self._organic_api_process.is_alive():
+                logger.warning(
+                    "Organic API process did not terminate gracefully, killing"
+                )
+                self._organic_api_process.kill()
+
+    async def stop_rqlited(self):
+        """Stops the rqlite read node without blocking the event loop.
 
-            block_difference = (
-                self.metagraph.block - self.metagraph.neurons[self.uid].last_update
+        rqlited is started outside the validator (scripts/start_read_node.sh), so
+        there is no child process handle. The signal is limited to this user's
+        processes named exactly rqlited.
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "pkill", "-x", "-U", str(os.getuid()), "rqlited"
             )
-            if block_difference > 3 * self.config.neuron.epoch_length:
-                logger.error(
-                    f"Haven't set blocks in {block_difference} blocks. Restarting validator."
-                )
-                self.should_exit = True
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Failed to stop rqlited: {e}")
 
-    async def __aenter__(self):
-        await asyncio.sleep(10)  # Wait for rqlite to start
+    def start_background_task(
+        self, coro: Coroutine, name: Optional[str] = None
+    ) -> asyncio.Task:
+        """Starts a long-running task that is cancelled when the validator exits.
+
+        The task's name shows up in failure logs and asyncio task dumps.
+
+        If the task fails, the error is logged and the validator is marked to exit
+        so that it restarts instead of running without the task.
+        """
+        task = self.loop.create_task(coro, name=name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return task
+
+    def _on_background_task_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        exception = task.exception()
+        if exception is not None:
+            logger.error(
+                f"Background task {task.get_name()} failed: {exception!r}. "
+                "Restarting validator."
+            )
+            self.should_exit = True
+
+    async def run_with_backoff(
+        self,
+        name: str,
+        loop_fn: Callable[[], Awaitable[Any]],
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        """Runs `loop_fn`, restarting it with jittered exponential backoff if it raises.
+
+        The delay doubles after each crash up to `max_delay`, and starts over once the
+        loop has stayed up for longer than `max_delay`.
+        """
+        delay = base_delay
+        while not self.should_exit:
+            started = self.loop.time()
+            try:
+                await loop_fn()
+                return
+            except Exception:
+                logger.exception(f"{name} crashed, restarting it")
+
+            if self.loop.time() - started > max_delay:
+                delay = base_delay
+            await asyncio.sleep(random.uniform(0, delay))
+            delay = min(max_delay, delay * 2)
+
+    async def wait_for_rqlite(self, timeout: float = 30.0):
+        """Waits until the local rqlite node accepts connections on its HTTP port.
+
+        Gives up after `timeout` seconds and lets the validator start anyway, as the
+        store calls already handle rqlite being unavailable.
+        """
+        port = int(os.getenv("RQLITE_HTTP_ADDR", "0.0.0.0:4001").rsplit(":", 1)[1])
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                await asyncio.sleep(0.05)
+                continue
+            writer.close()
+            await writer.wait_closed()
+            return
+        logger.warning(f"rqlite is not accepting connections on port {port}")
+
+    async def _stop_child_processes(self):
+        # The organic API process and rqlited are independent, so wind them down at
+        # the same time.
+        await asyncio.gather(self.stop_organic_api(), self.stop_rqlited())
 
-        self.loop.create_task(self.sync_loop())
-        self.loop.create_task(self.update_jobs())
-        self.loop.create_task(self.create_synthetic_jobs())
-        self.loop.create_task(self.reward_loop())
+    async def _cancel_background_tasks(self):
+        # Cancel the background tasks and wait for them, so none is left suspended
+        # mid-await when the loop stops.
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self):
+        # Exit callbacks run last-in first-out: the background tasks are cancelled
+        # before the child processes they talk to are stopped.
+        self._exit_stack.push_async_callback(self._stop_child_processes)
+        await self.wait_for_rqlite()
+
+        # Loops that are meant to run for the validator's lifetime are restarted
+        # with backoff if they crash.
+        loops = [
+            ("sync_loop", self.sync_loop),
+            ("log_consumer", self._log_consumer),
+            ("update_jobs", self.update_jobs),
+            ("create_synthetic_jobs", self.create_synthetic_jobs),
+            ("reward_loop", self.reward_loop),
+        ]
         if self.config.neuron.organic_enabled:
             logger.info("Starting organic scoring loop.")
-            self.loop.create_task(self._organic_scoring.start_loop())
-            self.loop.create_task(self.start_organic_api())
-        self.loop.create_task(self.monitor_validator())
+            loops.append(("organic_scoring", self._organic_scoring.start_loop))
+
+        for name, loop_fn in loops:
+            self.start_background_task(self.run_with_backoff(name, loop_fn), name=name)
+        if self.config.neuron.organic_enabled:
+            self.start_background_task(
+                self.start_organic_api(), name="start_organic_api"
+            )
+        self.start_background_task(self.monitor_validator(), name="monitor_validator")
+        self._exit_stack.push_async_callback(self._cancel_background_tasks)
         self.is_running = True
         logger.debug("Starting validator in background thread.")
         return self
@@ -821,33 +1121,41 @@ class Validator(BaseValidatorNeuron):
             traceback: A traceback object encoding the stack trace.
                        None if the context was exited without an exception.
         """
-        if self.is_running:
-            logger.debug("Stopping validator in background thread.")
-            self.should_exit = True
-            self.is_running = False
-
-            # Terminate the organic API process if it exists
-            if self._organic_api_process and self._organic_api_process.is_alive():
-                logger.info("Terminating organic API process")
-                self._organic_api_process.terminate()
-                self._organic_api_process.join(timeout=5)
-                if self._organic_api_process.is_alive():
-                    logger.warning(
-                        "Organic API process did not terminate gracefully, killing"
-                    )
-                    self._organic_api_process.kill()
+        # Only the first call shuts down, so repeated signals can't run the
+        # cleanups twice.
+        if self._shutdown_started:
+            return
+        self._shutdown_started = True
+
+        logger.debug("Stopping validator in background thread.")
+        self.should_exit = True
+        self.is_running = False
 
-            os.system("pkill rqlited")
-            self.loop.stop()
-            logger.debug("Stopped")
+        await self._exit_stack.aclose()
+        logger.debug("Stopped")
 
 
 async def main():
     async with Validator() as v:
-        while v.is_running and not v.should_exit:
-            await asyncio.sleep(30)
+        # SIGTERM/SIGINT set the exit event like any other shutdown request, so
+        # __aexit__ gets to clean up the child processes instead of the process
+        # dying mid-await.
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, v.exit_event.set)
+
+        await v.wait_closed()
 
 
 # The main function parses the configuration and runs the validator.
 if __name__ == "__main__":
+    # uvloop is optional: it lowers the per-callback cost of the many long-lived
+    # tasks, and the stock asyncio loop is used when it isn't installed.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
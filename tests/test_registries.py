@@ -78,3 +78,31 @@ def test_miner_credibilities():
         miner_registry.registry[miner_uid].tasks[task_name].credibility
         < STARTING_CREDIBILITY
     )
+
+
+def test_add_credibilities_bulk():
+    """
+    Test that add_credibilities_bulk and update_credibilities match per-miner calls.
+    """
+    bulk_registry = setup_registry()
+    single_registry = setup_registry()
+    task_name = bulk_registry.tasks[0]
+
+    miner_uids = [1, 2, 3]
+    credibilities = [1.0, 0.0, 1.0]
+
+    bulk_registry.add_credibilities_bulk(
+        miner_uids=miner_uids, task=task_name, credibilities=credibilities
+    )
+    for miner_uid, credibility in zip(miner_uids, credibilities):
+        single_registry.add_credibilities(
+            miner_uid=miner_uid, task=task_name, credibilities=[credibility]
+        )
+
+    bulk_registry.update_credibilities(miner_uids=miner_uids, task=task_name)
+    for miner_uid in miner_uids:
+        single_registry.update_credibility(miner_uid=miner_uid, task=task_name)
+        assert (
+            bulk_registry.registry[miner_uid].tasks[task_name].credibility
+            == single_registry.registry[miner_uid].tasks[task_name].credibility
+        )
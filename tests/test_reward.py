@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from folding.utils import constants as c
+from folding.registries.miner_registry import MinerRegistry
+from folding.validators.reward import run_evaluation_validation_pipeline
+
+
+class MockEvaluator:
+    """Evaluator whose validation returns a fixed median and energy trace."""
+
+    def __init__(self, median_energy: float, final_energies: list):
+        self.median_energy = median_energy
+        self.final_miner_energies = final_energies
+        self.intermediate_checkpoint_files = {}
+        self.pdb_files = {}
+
+    async def validate(self, validator, job_id, axon):
+        checked_energies = {"final": self.final_miner_energies}
+        miner_energies = {"final": self.final_miner_energies}
+        return self.median_energy, checked_energies, miner_energies, c.REASON_VALID
+
+
+def finished_evaluation(uid: int, evaluator: MockEvaluator, reported_energy: float):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(
+        (uid, evaluator, {"reported_energy": reported_energy, "files": {}})
+    )
+    return future
+
+
+@pytest.mark.asyncio
+async def test_anomalous_uid_does_not_shift_next_energy():
+    """An anomalous miner followed by a valid one: only the valid one gets an energy."""
+    uids = [1, 2]
+    miner_registry = MinerRegistry(miner_uids=uids)
+    job_type = miner_registry.tasks[0]
+
+    # uid 1 reports the lowest energy but validates far away from it.
+    anomalous = MockEvaluator(median_energy=-200.0, final_energies=[-200.0] * 5)
+    valid_energies = [-95.0, -90.0, -90.0, -85.0, -90.0]
+    valid = MockEvaluator(median_energy=-90.0, final_energies=valid_energies)
+
+    energies, event, _ = await run_evaluation_validation_pipeline(
+        validator=SimpleNamespace(handler=None, evaluation_executor=None),
+        protein=None,
+        responses=[None, None],
+        uids=uids,
+        miner_registry=miner_registry,
+        job_type=job_type,
+        job_id="job",
+        axons={uid: None for uid in uids},
+        evaluations=[
+            finished_evaluation(1, anomalous, reported_energy=-100.0),
+            finished_evaluation(2, valid, reported_energy=-90.0),
+        ],
+    )
+
+    assert energies == [0, -90.0]
+    assert event["processed_uids"] == [1, 2]
+    assert event["is_valid"] == [False, True]
+    assert event["is_duplicate"] == [False, False]
+    assert event["reason"][0] == "energy_difference_too_large"
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from folding.utils.uids import (
+    check_uid_availability,
+    clear_availability_cache,
+    get_all_miner_uids,
+)
+
+
+def make_metagraph(stakes, serving):
+    """
+    Helper function to build a minimal metagraph stand-in.
+
+    Returns:
+        SimpleNamespace: An object exposing the n, S and axons attributes used by the uid helpers.
+    """
+    return SimpleNamespace(
+        n=np.array(len(stakes)),
+        block=np.array(1),
+        S=np.array(stakes, dtype=np.float32),
+        axons=[SimpleNamespace(is_serving=s) for s in serving],
+    )
+
+
+def test_get_all_miner_uids_matches_per_uid_check():
+    """
+    Test that the vectorized get_all_miner_uids agrees with check_uid_availability for every uid.
+    """
+    metagraph = make_metagraph(
+        stakes=[0.0, 2048.0, 10.0, 1024.0, 5000.0, 0.5],
+        serving=[True, True, False, True, False, True],
+    )
+
+    for include_serving in (True, False):
+        expected = [
+            uid
+            for uid in range(len(metagraph.axons))
+            if check_uid_availability(metagraph, uid, 1024, include_serving)
+        ]
+        assert (
+            get_all_miner_uids(
+                metagraph, 1024, include_serving_in_check=include_serving
+            )
+            == expected
+        )
+
+
+def test_clear_availability_cache_picks_up_synced_metagraph():
+    """
+    Test that clearing the cache makes get_all_miner_uids see a metagraph updated in place.
+    """
+    metagraph = make_metagraph(stakes=[0.0, 0.0, 0.0], serving=[True, True, True])
+    clear_availability_cache()
+    assert get_all_miner_uids(metagraph, 1024) == [0, 1, 2]
+
+    # Same block, so the cached result is returned until the cache is cleared.
+    metagraph.S[1] = 4096.0
+    assert get_all_miner_uids(metagraph, 1024) == [0, 1, 2]
+
+    clear_availability_cache()
+    assert get_all_miner_uids(metagraph, 1024) == [0, 2]